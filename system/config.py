@@ -11,6 +11,13 @@ DEFAULT_EXCEL_FILENAME = "物种检测信息.xlsx"
 SUPPORTED_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.webp')
 DATE_FORMATS = ['%Y:%m:%d %H:%M:%S', '%Y:%d:%m %H:%M:%S', '%Y-%m-%d %H:%M:%S']
 INDEPENDENT_DETECTION_THRESHOLD = 30 * 60  # 30分钟，单位：秒
+PREFETCH_WORKERS = 2  # 批量处理时后台预读图像的线程数
+PREFETCH_DEPTH = 4  # 批量处理时最多提前读取的图像数量
+DETECTION_BATCH_SIZE = 4  # 批量处理时每次送入模型的图像数量
+IO_WORKERS = 2  # 批量处理时后台保存检测结果的线程数
+IO_QUEUE_DEPTH = 32  # 批量处理时最多积压的未完成保存任务数
+CACHE_INTERVAL = 32  # 批量处理时每处理多少张图像保存一次断点进度
+CUDA_CACHE_RELEASE_INTERVAL = 256  # 批量处理时每处理多少张图像归还一次缓存的显存
 
 # 界面相关常量
 PADDING = 10
@@ -18,3 +25,7 @@ BUTTON_WIDTH = 14
 LARGE_FONT = ('Segoe UI', 11)
 NORMAL_FONT = ('Segoe UI', 10)
 SMALL_FONT = ('Segoe UI', 9)
+VIRTUAL_LIST_THRESHOLD = 500  # 下拉列表条目超过此数量时改用虚拟列表
+UI_REFRESH_INTERVAL = 100  # 批量处理时界面刷新间隔，单位：毫秒
+THEME_EVENT_POLL_INTERVAL = 500  # 主线程取回系统主题变化通知的间隔，单位：毫秒
+PREVIEW_CACHE_SIZE = 16  # 预览页缓存的已解码图像数量，来回切换时无需重新解码
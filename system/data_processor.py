@@ -16,22 +16,33 @@ class DataProcessor:
     """数据处理类，处理图像信息集合"""
 
     @staticmethod
-    def calculate_working_days(image_info_list: List[Dict], earliest_date: Optional[datetime]) -> List[Dict]:
+    def _to_datetime(value) -> Optional[datetime]:
+        """将ISO格式的拍摄日期字符串转换为datetime，已是datetime时原样返回"""
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        return value
+
+    @staticmethod
+    def calculate_working_days(image_info_list: List[Dict], earliest_date) -> List[Dict]:
         """计算每张图片的工作天数
 
         Args:
             image_info_list: 图像信息列表
-            earliest_date: 最早的拍摄日期
+            earliest_date: 最早的拍摄日期（ISO字符串或datetime）
 
         Returns:
             更新后的图像信息列表
         """
+        earliest_date = DataProcessor._to_datetime(earliest_date)
         if not earliest_date:
             logger.warning("无法计算工作天数：未找到任何有效拍摄日期")
             return image_info_list
 
         for info in image_info_list:
-            date_taken = info.get('拍摄日期对象')
+            date_taken = DataProcessor._to_datetime(info.get('拍摄日期对象'))
             if date_taken:
                 working_days = (date_taken.date() - earliest_date.date()).days + 1
                 info['工作天数'] = working_days
@@ -48,7 +59,7 @@ class DataProcessor:
         Returns:
             更新后的图像信息列表
         """
-        # 按拍摄日期排序
+        # 按拍摄日期排序，ISO字符串的字典序即时间顺序
         sorted_images = sorted(
             [img for img in image_info_list if img.get('拍摄日期对象')],
             key=lambda x: x['拍摄日期对象']
@@ -57,13 +68,16 @@ class DataProcessor:
         species_last_detected = {}  # 记录每个物种的最后探测时间
 
         for img_info in sorted_images:
-            species_names = img_info['物种名称'].split(',')
-            current_time = img_info.get('拍摄日期对象')
+            names_text = img_info['物种名称']
+            current_time = DataProcessor._to_datetime(img_info.get('拍摄日期对象')) if names_text else None
 
-            if not current_time or not species_names or species_names == ['']:
+            # 无物种的图像直接跳过，不做拆分和日期转换
+            if not current_time:
                 img_info['独立探测首只'] = ''
                 continue
 
+            species_names = names_text.split(',')
+
             is_independent = False
 
             for species in species_names:
@@ -1,11 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
-import os
 import shutil
 
 from system.config import APP_TITLE, NORMAL_FONT
-from system.utils import resource_path
+from system.gui.ui_components import load_logo_photo
 
 
 class AboutPage(ttk.Frame):
@@ -23,10 +21,7 @@ class AboutPage(ttk.Frame):
 
         # 应用Logo
         try:
-            logo_path = resource_path(os.path.join("res", "logo.png"))
-            logo_img = Image.open(logo_path)
-            logo_img = logo_img.resize((120, 120), Image.LANCZOS)
-            self.logo_photo = ImageTk.PhotoImage(logo_img)
+            self.logo_photo = load_logo_photo((120, 120))
             logo_label = ttk.Label(about_content, image=self.logo_photo)
             logo_label.pack(pady=(20, 10))
         except Exception:
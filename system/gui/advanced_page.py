@@ -7,17 +7,25 @@ import subprocess
 import logging
 import threading
 import sys
+import queue
 
-from system.gui.ui_components import CollapsiblePanel
+from system.gui.ui_components import CollapsiblePanel, VirtualListPopup
 from system.utils import resource_path
-from system.config import APP_VERSION
+from system.config import APP_VERSION, VIRTUAL_LIST_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# 平台判断在导入时计算一次，避免在滚轮等高频事件中重复调用platform.system()
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_DARWIN = platform.system() == "Darwin"
+
 
 class AdvancedPage(ttk.Frame):
     """高级设置页面"""
 
+    # 已配置过页面样式的ttk主题，样式按主题保存，每个主题只需配置一次
+    _configured_themes = set()
+
     def __init__(self, parent, controller, **kwargs):
         super().__init__(parent, **kwargs)
         self.controller = controller
@@ -26,8 +34,12 @@ class AdvancedPage(ttk.Frame):
         self.controller.iou_var = tk.DoubleVar(value=0.3)
         self.controller.conf_var = tk.DoubleVar(value=0.25)
         self.controller.use_fp16_var = tk.BooleanVar(value=self.controller.cuda_available)
+        self.controller.use_tensorrt_var = tk.BooleanVar(value=False)
+        self.controller.use_int8_var = tk.BooleanVar(value=False)
         self.controller.use_augment_var = tk.BooleanVar(value=True)
         self.controller.use_agnostic_nms_var = tk.BooleanVar(value=True)
+        # 拖动滑块时待刷新的标签更新，键为更新函数，值为最新的滑块值
+        self._pending_label_values = {}
 
         # Keybinding variables
         self.key_up_var = tk.StringVar(value='<Up>')
@@ -40,11 +52,22 @@ class AdvancedPage(ttk.Frame):
 
         self.cache_size_var = tk.StringVar(value="正在计算...")
 
+        # 当前模型名称，环境维护页重建时复用同一个变量
+        self.current_model_var = tk.StringVar(value="")
+        self._all_models = []
+        # 模型目录扫描结果缓存: (目录修改时间, 模型文件列表)，目录未变化时跳过listdir
+        self._model_list_cache = None
+        self._last_params_region = None
+        self.env_canvas = None
+        self.software_canvas = None
+
+        self._configure_styles()
         self._create_widgets()
 
     def update_theme(self):
         """更新此页面上所有自定义组件的主题"""
         self.is_dark_mode = self.controller.is_dark_mode
+        self._configure_styles()
         # 更新所有可折叠面板
         panels = [
             self.threshold_panel, self.accel_panel, self.advanced_detect_panel,
@@ -62,6 +85,19 @@ class AdvancedPage(ttk.Frame):
         self.env_canvas.config(bg=bg_color)
         self.software_canvas.config(bg=bg_color)
 
+    def _configure_styles(self) -> None:
+        """配置本页面使用的ttk样式，同一主题下只配置一次"""
+        style = ttk.Style()
+        theme = style.theme_use()
+        if theme in AdvancedPage._configured_themes:
+            return
+        AdvancedPage._configured_themes.add(theme)
+
+        style.configure("Dropdown.TCombobox", padding=(10, 5))
+        style.configure("Action.TButton", font=("Segoe UI", 9))
+        style.configure("Secondary.TButton", font=("Segoe UI", 9))
+        style.configure("ReadOnly.TEntry", fieldbackground="#f0f0f0" if not self.is_dark_mode else "#3a3a3a")
+
     def _create_widgets(self) -> None:
         """创建高级设置页面的控件"""
         self.advanced_notebook = ttk.Notebook(self)
@@ -289,19 +325,21 @@ class AdvancedPage(ttk.Frame):
         self.master.update_idletasks()
 
         def get_dir_size(path):
+            # 直接使用目录项的类型和大小信息，不再为每个文件单独拼接路径和stat
             total_size = 0
             try:
-                for dirpath, dirnames, filenames in os.walk(path):
-                    for f in filenames:
-                        fp = os.path.join(dirpath, f)
-                        if not os.path.islink(fp):
-                            total_size += os.path.getsize(fp)
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            total_size += get_dir_size(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
             except FileNotFoundError:
                 return 0  # Path doesn't exist
             return total_size
 
         def size_thread():
-            cache_dir = os.path.join(self.controller.settings_manager.base_dir, "temp", "photo")
+            cache_dir = self.controller.settings_manager.photo_dir
             size_in_bytes = get_dir_size(cache_dir)
 
             if size_in_bytes < 1024:
@@ -319,8 +357,7 @@ class AdvancedPage(ttk.Frame):
         self.master.after(500, lambda: threading.Thread(target=size_thread, daemon=True).start())
 
     def _clear_image_cache_with_refresh(self):
-        self.controller.clear_image_cache()
-        self.master.after(500, self.update_cache_size)
+        self.controller.clear_image_cache(on_done=self.update_cache_size)
 
     def _configure_software_scrolling(self):
         """配置软件设置页面的滚动"""
@@ -334,26 +371,22 @@ class AdvancedPage(ttk.Frame):
                 self.software_canvas.itemconfigure(self.software_canvas_window, width=canvas_width)
 
         def _on_mousewheel(event):
-            if platform.system() == "Windows":
+            if event.num in (4, 5):
+                # X11下滚轮以Button-4/5事件送达
+                self.software_canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+            elif _IS_WINDOWS:
                 self.software_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
             else:
                 self.software_canvas.yview_scroll(int(event.delta), "units")
+            return "break"
 
+        # 滚轮只绑定在画布本身，不使用bind_all，避免每次滚动都经过全局处理
         self.software_canvas.bind("<MouseWheel>", _on_mousewheel)
+        self.software_canvas.bind("<Button-4>", _on_mousewheel)
+        self.software_canvas.bind("<Button-5>", _on_mousewheel)
         self.software_content_frame.bind("<Configure>", _update_scrollregion)
         self.software_canvas.bind("<Configure>", _configure_canvas)
 
-    def _on_tab_changed(self, event):
-        current_tab_index = self.advanced_notebook.index(self.advanced_notebook.select())
-        if current_tab_index == 1:  # Env Maintenance
-            if hasattr(self, 'env_canvas'):
-                self.master.after(10, lambda: self.env_canvas.configure(scrollregion=self.env_canvas.bbox("all")))
-        elif current_tab_index == 2:  # Software Settings
-            if hasattr(self, 'software_canvas'):
-                self.master.after(10,
-                                  lambda: self.software_canvas.configure(scrollregion=self.software_canvas.bbox("all")))
-                self.update_cache_size()
-
     def _create_model_params_content(self) -> None:
         """创建模型参数设置内容"""
         main_frame = ttk.Frame(self.model_params_tab)
@@ -400,7 +433,7 @@ class AdvancedPage(ttk.Frame):
             to=0.9,
             orient="horizontal",
             variable=self.controller.iou_var,
-            command=self._update_iou_label
+            command=lambda value: self._schedule_label_update(self._update_iou_label, value)
         )
         iou_scale.pack(fill="x")
 
@@ -417,7 +450,7 @@ class AdvancedPage(ttk.Frame):
             to=0.95,
             orient="horizontal",
             variable=self.controller.conf_var,
-            command=self._update_conf_label
+            command=lambda value: self._schedule_label_update(self._update_conf_label, value)
         )
         conf_scale.pack(fill="x")
 
@@ -438,6 +471,20 @@ class AdvancedPage(ttk.Frame):
             state="normal" if self.controller.cuda_available else "disabled"
         )
         fp16_check.pack(anchor="w")
+        tensorrt_check = ttk.Checkbutton(
+            fp16_frame,
+            text="使用TensorRT引擎 (需要安装TensorRT，首次使用需构建引擎，不支持数据增强)",
+            variable=self.controller.use_tensorrt_var,
+            state="normal" if self.controller.cuda_available else "disabled"
+        )
+        tensorrt_check.pack(anchor="w", pady=(5, 0))
+        int8_check = ttk.Checkbutton(
+            fp16_frame,
+            text="使用INT8量化 (需启用TensorRT，首次使用时以当前图像文件夹校准)",
+            variable=self.controller.use_int8_var,
+            state="normal" if self.controller.cuda_available else "disabled"
+        )
+        int8_check.pack(anchor="w", pady=(5, 0))
         if not self.controller.cuda_available:
             cuda_warning = ttk.Label(
                 fp16_frame,
@@ -529,9 +576,9 @@ class AdvancedPage(ttk.Frame):
         )
         self.pytorch_panel.pack(fill="x", expand=False, pady=(0, 1))
 
-        version_frame = ttk.Frame(self.pytorch_panel.content_padding)
-        version_frame.pack(fill="x", pady=5)
-        ttk.Label(version_frame, text="选择版本").pack(side="top", anchor="w", pady=(0, 5))
+        # 静态文字与输入控件直接放入面板内容区，不再额外包裹一层 Frame
+        pytorch_content = self.pytorch_panel.content_padding
+        ttk.Label(pytorch_content, text="选择版本").pack(side="top", anchor="w", pady=(5, 5))
         self.pytorch_version_var = tk.StringVar()
         versions = [
             "2.7.1 (CUDA 12.8)",
@@ -539,27 +586,24 @@ class AdvancedPage(ttk.Frame):
             "2.7.1 (CUDA 11.8)",
             "2.7.1 (CPU Only)",
         ]
-        style.configure("Dropdown.TCombobox", padding=(10, 5))
         version_combo = ttk.Combobox(
-            version_frame,
+            pytorch_content,
             textvariable=self.pytorch_version_var,
             values=versions,
             state="readonly",
             style="Dropdown.TCombobox"
         )
-        version_combo.pack(fill="x", expand=True)
+        version_combo.pack(fill="x", pady=(0, 5))
         version_combo.current(0)
 
-        options_frame = ttk.Frame(self.pytorch_panel.content_padding)
-        options_frame.pack(fill="x", pady=10)
         ttk.Label(
-            options_frame,
+            pytorch_content,
             text="将先卸载现有的torch、torchvision、torchaudio模块再重新安装",
             foreground="#666666",
             font=("Segoe UI", 8)
-        ).pack(anchor="w", padx=(0, 0))
+        ).pack(anchor="w", pady=10)
 
-        bottom_frame = ttk.Frame(self.pytorch_panel.content_padding)
+        bottom_frame = ttk.Frame(pytorch_content)
         bottom_frame.pack(fill="x", pady=(10, 0))
         self.pytorch_status_var = tk.StringVar(value="")
         ttk.Label(bottom_frame, textvariable=self.pytorch_status_var).pack(side="left")
@@ -569,7 +613,6 @@ class AdvancedPage(ttk.Frame):
             command=self._install_pytorch,
             style="Action.TButton"
         )
-        style.configure("Action.TButton", font=("Segoe UI", 9))
         self.install_button.pack(side="right")
 
         self.model_panel = CollapsiblePanel(
@@ -580,30 +623,29 @@ class AdvancedPage(ttk.Frame):
         )
         self.model_panel.pack(fill="x", expand=False, pady=(0, 1))
 
-        model_selection_frame = ttk.Frame(self.model_panel.content_padding)
-        model_selection_frame.pack(fill="x", pady=5)
-        ttk.Label(model_selection_frame, text="当前使用的模型").pack(anchor="w", pady=(0, 5))
+        model_content = self.model_panel.content_padding
+        ttk.Label(model_content, text="当前使用的模型").pack(anchor="w", pady=(5, 5))
         model_name = os.path.basename(self.controller.image_processor.model_path) if hasattr(
             self.controller.image_processor, 'model_path') and self.controller.image_processor.model_path else "未知"
-        self.current_model_var = tk.StringVar(value=model_name)
-        style.configure("ReadOnly.TEntry", fieldbackground="#f0f0f0" if not self.is_dark_mode else "#3a3a3a")
+        self._set_current_model(model_name)
         current_model_entry = ttk.Entry(
-            model_selection_frame,
+            model_content,
             textvariable=self.current_model_var,
             state="readonly",
             style="ReadOnly.TEntry"
         )
-        current_model_entry.pack(fill="x", expand=True, pady=(0, 10))
-        ttk.Label(model_selection_frame, text="选择可用模型").pack(anchor="w", pady=(0, 5))
+        current_model_entry.pack(fill="x", pady=(0, 10))
+        ttk.Label(model_content, text="选择可用模型").pack(anchor="w", pady=(0, 5))
         #self.model_selection_var = tk.StringVar()
         self.model_combobox = ttk.Combobox(
-            model_selection_frame,
+            model_content,
             textvariable=self.controller.model_var,
             state="readonly",
             style="Dropdown.TCombobox"
         )
-        self.model_combobox.pack(fill="x", expand=True)
-        model_buttons_frame = ttk.Frame(self.model_panel.content_padding)
+        self.model_combobox.pack(fill="x", pady=(0, 5))
+        self.model_combobox.bind("<Button-1>", self._on_model_combobox_click)
+        model_buttons_frame = ttk.Frame(model_content)
         model_buttons_frame.pack(fill="x", pady=10)
         self.model_status_var = tk.StringVar(value="")
         ttk.Label(model_buttons_frame, textvariable=self.model_status_var).pack(side="left")
@@ -613,7 +655,6 @@ class AdvancedPage(ttk.Frame):
             command=self._refresh_model_list,
             style="Secondary.TButton"
         )
-        style.configure("Secondary.TButton", font=("Segoe UI", 9))
         refresh_btn.pack(side="right", padx=(0, 5))
         apply_btn = ttk.Button(
             model_buttons_frame,
@@ -631,25 +672,22 @@ class AdvancedPage(ttk.Frame):
         )
         self.python_panel.pack(fill="x", expand=False, pady=(0, 1))
 
-        package_frame = ttk.Frame(self.python_panel.content_padding)
-        package_frame.pack(fill="x", pady=5)
-        ttk.Label(package_frame, text="输入包名称").pack(anchor="w", pady=(0, 5))
+        python_content = self.python_panel.content_padding
+        ttk.Label(python_content, text="输入包名称 (多个包以空格分隔)").pack(anchor="w", pady=(5, 5))
         self.package_var = tk.StringVar()
-        ttk.Entry(package_frame, textvariable=self.package_var).pack(fill="x", expand=True)
+        ttk.Entry(python_content, textvariable=self.package_var).pack(fill="x", pady=(0, 5))
 
-        version_constraint_frame = ttk.Frame(self.python_panel.content_padding)
-        version_constraint_frame.pack(fill="x", pady=10)
-        ttk.Label(version_constraint_frame, text="版本约束 (可选)").pack(anchor="w", pady=(0, 5))
+        ttk.Label(python_content, text="版本约束 (可选)").pack(anchor="w", pady=(10, 5))
         self.version_constraint_var = tk.StringVar()
-        ttk.Entry(version_constraint_frame, textvariable=self.version_constraint_var).pack(fill="x", expand=True)
+        ttk.Entry(python_content, textvariable=self.version_constraint_var).pack(fill="x")
         ttk.Label(
-            version_constraint_frame,
+            python_content,
             text="示例: ==1.0.0, >=2.0.0, <3.0.0",
             font=("Segoe UI", 8),
             foreground="#888888"
-        ).pack(anchor="w", pady=(2, 0))
+        ).pack(anchor="w", pady=(2, 10))
 
-        package_buttons_frame = ttk.Frame(self.python_panel.content_padding)
+        package_buttons_frame = ttk.Frame(python_content)
         package_buttons_frame.pack(fill="x", pady=(10, 0))
         self.package_status_var = tk.StringVar(value="")
         ttk.Label(package_buttons_frame, textvariable=self.package_status_var).pack(side="left")
@@ -661,6 +699,10 @@ class AdvancedPage(ttk.Frame):
         )
         self.install_package_btn.pack(side="right")
 
+        self.package_log_text = tk.Text(python_content, height=8, font=("Consolas", 9), wrap="word")
+        self.package_log_text.pack(fill="x", pady=(10, 0))
+        self.package_log_text.config(state="disabled")
+
         self._refresh_model_list()
         self._check_pytorch_status()
         self._configure_env_scrolling()
@@ -676,8 +718,7 @@ class AdvancedPage(ttk.Frame):
                 self.params_canvas.itemconfigure(self.params_canvas_window, width=canvas_width)
 
         def _on_mousewheel(event):
-            view_pos = self.params_canvas.yview()
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 delta = -1 if event.delta > 0 else 1
             else:
                 if hasattr(event, 'num'):
@@ -685,13 +726,8 @@ class AdvancedPage(ttk.Frame):
                 else:
                     return
 
-            if delta < 0 and view_pos[0] < 0.1:
-                self.params_canvas.yview_moveto(0)
-            else:
-                self.params_canvas.yview_scroll(delta, "units")
-
-            if self.params_canvas.yview()[0] < 0.001:
-                self.params_canvas.yview_moveto(0)
+            # 由Tk按滚动单位（可视高度的十分之一）移动视图并限制在滚动区域内，每次滚轮只需一次调用
+            self.params_canvas.yview_scroll(delta, "units")
             return "break"
 
         self.params_canvas.bind("<MouseWheel>", _on_mousewheel)
@@ -710,8 +746,7 @@ class AdvancedPage(ttk.Frame):
                 self.env_canvas.itemconfigure(self.env_canvas_window, width=canvas_width)
 
         def _on_mousewheel(event):
-            view_pos = self.env_canvas.yview()
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 delta = -1 if event.delta > 0 else 1
             else:
                 if hasattr(event, 'num'):
@@ -719,12 +754,8 @@ class AdvancedPage(ttk.Frame):
                 else:
                     return
 
-            if delta < 0 and view_pos[0] < 0.1:
-                self.env_canvas.yview_moveto(0)
-            else:
-                self.env_canvas.yview_scroll(delta, "units")
-            if self.env_canvas.yview()[0] < 0.001:
-                self.env_canvas.yview_moveto(0)
+            # 由Tk按滚动单位（可视高度的十分之一）移动视图并限制在滚动区域内，每次滚轮只需一次调用
+            self.env_canvas.yview_scroll(delta, "units")
             return "break"
 
         self.env_canvas.bind("<MouseWheel>", _on_mousewheel)
@@ -737,7 +768,12 @@ class AdvancedPage(ttk.Frame):
         current_pos = self.params_canvas.yview()
         was_at_top = current_pos[0] <= 0.001
         self.params_content_frame.update_idletasks()
-        self.params_canvas.configure(scrollregion=self.params_canvas.bbox("all"))
+        new_region = self.params_canvas.bbox("all")
+        # 滚动区域没有变化时无需重新校正位置
+        if new_region == self._last_params_region and was_at_top:
+            return
+        self._last_params_region = new_region
+        self.params_canvas.configure(scrollregion=new_region)
         if was_at_top:
             self.params_canvas.yview_moveto(0.0)
         self.master.after(50, self._force_check_params_top)
@@ -747,6 +783,18 @@ class AdvancedPage(ttk.Frame):
         if 0 < current_pos[0] < 0.01:
             self.params_canvas.yview_moveto(0.0)
 
+    def _schedule_label_update(self, update, value):
+        """拖动滑块时合并标签更新，每30毫秒只按最新的值刷新一次"""
+        pending = update in self._pending_label_values
+        self._pending_label_values[update] = value
+        if not pending:
+            self.after(30, self._flush_label_update, update)
+
+    def _flush_label_update(self, update):
+        value = self._pending_label_values.pop(update, None)
+        if value is not None:
+            update(value)
+
     def _update_iou_label(self, value):
         """更新IOU标签并设置保留两位小数的值"""
         rounded_value = round(float(value), 2)
@@ -765,6 +813,8 @@ class AdvancedPage(ttk.Frame):
         self.controller.conf_var.set(0.25)
         self._update_conf_label(0.25)
         self.controller.use_fp16_var.set(self.controller.cuda_available)
+        self.controller.use_tensorrt_var.set(False)
+        self.controller.use_int8_var.set(False)
         self.controller.use_augment_var.set(True)
         self.controller.use_agnostic_nms_var.set(True)
         # self.controller.status_bar.show_message("已重置所有参数到默认值", 3000)
@@ -811,7 +861,6 @@ class AdvancedPage(ttk.Frame):
 
         self.install_button.configure(state="disabled")
         self.pytorch_status_var.set("准备安装...")
-        self.master.update_idletasks()
 
         def install_thread():
             try:
@@ -822,21 +871,21 @@ class AdvancedPage(ttk.Frame):
 
         threading.Thread(target=install_thread, daemon=True).start()
 
-    def _get_python_command_prefix(self):
-        """获取用于调用pip的python.exe命令前缀"""
-        # --- 新增代码：动态获取python.exe路径 ---
+    def _get_python_executable(self):
+        """获取用于调用pip的python.exe路径"""
         program_root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         python_exe_path = os.path.join(program_root_dir, "toolkit", "python.exe")
 
         if not os.path.exists(python_exe_path):
             print(f"警告: 未在 {program_root_dir}\\toolkit 找到 python.exe, 将回退到默认python。")
-            # 在命令行中，直接用python可能无法找到正确的解释器，所以这里给出更明确的sys.executable
-            # 并用引号包裹以处理路径中的空格
-            return f'"{sys.executable}" -m pip'
-        else:
-            # 返回带引号的完整路径，准备在命令行中使用
-            return f'"{python_exe_path}" -m pip'
-        # --- 代码修改结束 ---
+            # 直接用python可能无法找到正确的解释器，所以这里给出更明确的sys.executable
+            return sys.executable
+        return python_exe_path
+
+    def _get_python_command_prefix(self):
+        """获取用于调用pip的python.exe命令前缀"""
+        # 返回带引号的完整路径，以处理命令行中路径包含空格的情况
+        return f'"{self._get_python_executable()}" -m pip'
 
     def _run_pytorch_install(self, pytorch_version, cuda_version=None):
         """使用弹出命令行窗口安装PyTorch"""
@@ -866,10 +915,10 @@ class AdvancedPage(ttk.Frame):
 
             self.master.after(0, lambda: self.pytorch_status_var.set("安装已启动，请查看命令行窗口"))
 
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 subprocess.Popen(f"start cmd /C \"{command}\"", shell=True)
             else:
-                if platform.system() == "Darwin":
+                if _IS_DARWIN:
                     mac_command = command.replace("timeout /t 5", "sleep 5")
                     subprocess.Popen(["osascript", "-e", f'tell app "Terminal" to do script "{mac_command}"'])
                 else:
@@ -893,9 +942,6 @@ class AdvancedPage(ttk.Frame):
                                                                 "安装完成后，重启程序以使更改生效。\n"
                                                                 "命令执行完成后窗口将在5秒后自动关闭。"))
 
-            version_text = f"{pytorch_version} {'(CUDA ' + cuda_version + ')' if cuda_version else '(CPU)'}"
-            self.master.after(3000, lambda: self.pytorch_status_var.set(f"已完成安装 PyTorch {version_text}"))
-
         except Exception as e:
             logger.error(f"安装PyTorch出错: {e}")
             self.master.after(0, lambda: self.pytorch_status_var.set(f"安装失败: {str(e)}"))
@@ -905,80 +951,131 @@ class AdvancedPage(ttk.Frame):
 
     def _install_python_package(self) -> None:
         """安装Python包"""
-        package = self.package_var.get().strip()
-        if not package:
+        # 支持一次输入多个包（以空格分隔），在同一个pip进程中安装；逗号属于版本说明符，不能作为分隔符
+        packages = self.package_var.get().split()
+        if not packages:
             messagebox.showerror("错误", "请输入包名称")
             return
 
         version_constraint = self.version_constraint_var.get().strip()
-        package_spec = f"{package}{version_constraint}" if version_constraint else package
+        if version_constraint and len(packages) > 1:
+            messagebox.showerror("错误", "版本约束仅适用于单个包")
+            return
+        package_specs = [f"{packages[0]}{version_constraint}"] if version_constraint else packages
+        package_spec = " ".join(package_specs)
 
         if not messagebox.askyesno("确认安装", f"将安装 {package_spec}\n\n是否继续？"):
             return
 
+        self.install_package_btn.configure(state="disabled")
         self.package_status_var.set("准备安装...")
-        self.master.update_idletasks()
 
         def install_thread():
             try:
-                self._run_pip_install(package_spec)
+                self._run_pip_install(package_specs)
             except Exception as e:
                 logger.error(f"安装Python包出错: {e}")
                 self.master.after(0, lambda: self.package_status_var.set(f"安装失败: {str(e)}"))
+                self.master.after(0, lambda: self.install_package_btn.configure(state="normal"))
 
         threading.Thread(target=install_thread, daemon=True).start()
 
-    def _run_pip_install(self, package_spec):
-        """使用弹出命令行窗口安装Python包"""
+    def _run_pip_install(self, package_specs):
+        """在后台直接运行pip安装Python包，并将输出实时显示在日志框中"""
+        package_spec = " ".join(package_specs)
         try:
-            self.master.after(0, lambda: self.package_status_var.set("正在启动安装..."))
-
-            # --- 修改代码：获取命令前缀 ---
-            pip_command_prefix = self._get_python_command_prefix()
-
-            install_cmd = f"{pip_command_prefix} install {package_spec}"
-            command = (
-                f"echo 正在安装 {package_spec}... && "
-                f"{install_cmd} && "
-                f"echo. && echo 安装完成！窗口将在5秒后自动关闭... && "
-                f"timeout /t 5"
+            self.master.after(0, lambda: self.package_status_var.set("正在安装..."))
+            self.master.after(0, self._clear_package_log)
+
+            command = [self._get_python_executable(), "-m", "pip", "--disable-pip-version-check",
+                       "install", *package_specs]
+            env = dict(os.environ, PYTHONIOENCODING="utf-8")
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                env=env,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
             )
 
-            self.master.after(0, lambda: self.package_status_var.set("安装已启动，请查看命令行窗口"))
-
-            if platform.system() == "Windows":
-                subprocess.Popen(f"start cmd /C \"{command}\"", shell=True)
-            else:
-                if platform.system() == "Darwin":
-                    mac_command = command.replace("timeout /t 5", "sleep 5")
-                    subprocess.Popen(["osascript", "-e", f'tell app "Terminal" to do script "{mac_command}"'])
-                else:
-                    linux_command = command.replace("timeout /t 5", "sleep 5")
-                    for terminal in ["gnome-terminal", "konsole", "xterm"]:
-                        try:
-                            subprocess.Popen([terminal, "-e", f"bash -c '{linux_command}; read -n1'"])
-                            break
-                        except FileNotFoundError:
-                            continue
-
-            self.master.after(3000, lambda: self.package_status_var.set(f"已完成安装 {package_spec}"))
+            output_queue = queue.Queue()
+            self.master.after(50, self._poll_pip_output, output_queue, package_spec)
+            for line in process.stdout:
+                output_queue.put(line)
+            process.stdout.close()
+            # 输出结束后放入进程退出码作为结束标记
+            output_queue.put(process.wait())
 
         except Exception as e:
             logger.error(f"安装Python包出错: {e}")
             self.master.after(0, lambda: self.package_status_var.set(f"安装失败: {str(e)}"))
+            self.master.after(0, lambda: self.install_package_btn.configure(state="normal"))
             self.master.after(0, lambda: messagebox.showerror("安装错误", f"安装Python包失败：\n{str(e)}"))
 
+    def _poll_pip_output(self, output_queue, package_spec):
+        """将pip输出写入日志框，收到退出码后更新安装状态"""
+        lines = []
+        return_code = None
+        try:
+            while return_code is None:
+                item = output_queue.get_nowait()
+                if isinstance(item, int):
+                    return_code = item
+                else:
+                    lines.append(item)
+        except queue.Empty:
+            pass
+        if lines:
+            self._append_package_log("".join(lines))
+
+        if return_code is None:
+            self.master.after(50, self._poll_pip_output, output_queue, package_spec)
+            return
+
+        if return_code == 0:
+            self.package_status_var.set(f"已完成安装 {package_spec}")
+        else:
+            self.package_status_var.set(f"安装失败(退出码{return_code})")
+        self.install_package_btn.configure(state="normal")
+
+    def _clear_package_log(self):
+        """清空pip安装日志框"""
+        self.package_log_text.config(state="normal")
+        self.package_log_text.delete(1.0, tk.END)
+        self.package_log_text.config(state="disabled")
+
+    def _append_package_log(self, text):
+        """向pip安装日志框追加文本并滚动到底部"""
+        self.package_log_text.config(state="normal")
+        self.package_log_text.insert(tk.END, text)
+        self.package_log_text.see(tk.END)
+        self.package_log_text.config(state="disabled")
+
     def _refresh_model_list(self):
         """刷新可用模型列表。"""
         res_dir = resource_path("res")
         try:
+            self._all_models = []
             self.model_combobox["values"] = []  # 清空旧列表
-            if os.path.exists(res_dir):
-                # 查找所有.pt模型文件
-                model_files = [f for f in os.listdir(res_dir) if f.lower().endswith('.pt')]
+            try:
+                mtime_ns = os.stat(res_dir).st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+            if mtime_ns is not None:
+                if self._model_list_cache and self._model_list_cache[0] == mtime_ns:
+                    model_files = self._model_list_cache[1]
+                else:
+                    # 查找所有.pt模型文件
+                    model_files = sorted(f for f in os.listdir(res_dir) if f.lower().endswith('.pt'))
+                    self._model_list_cache = (mtime_ns, model_files)
                 if model_files:
-                    model_files.sort()
-                    self.model_combobox["values"] = model_files
+                    self._all_models = model_files
+                    # 模型过多时不填充下拉框，改由虚拟列表按需渲染
+                    if len(model_files) < VIRTUAL_LIST_THRESHOLD:
+                        self.model_combobox["values"] = model_files
                     self.model_status_var.set(f"找到 {len(model_files)} 个模型文件")
                 else:
                     self.model_status_var.set("未找到任何模型文件")
@@ -988,6 +1085,18 @@ class AdvancedPage(ttk.Frame):
             logger.error(f"刷新模型列表失败: {e}")
             self.model_status_var.set(f"刷新失败: {str(e)}")
 
+    def _on_model_combobox_click(self, event):
+        """模型数量过多时用虚拟列表弹出框代替默认下拉列表"""
+        if len(self._all_models) < VIRTUAL_LIST_THRESHOLD:
+            return None
+        VirtualListPopup(
+            self.model_combobox,
+            self._all_models,
+            on_select=self.controller.model_var.set,
+            current=self.controller.model_var.get()
+        )
+        return "break"
+
     def _apply_selected_model(self):
         """应用用户在下拉框中选择的模型"""
         model_name = self.controller.model_var.get()
@@ -995,6 +1104,11 @@ class AdvancedPage(ttk.Frame):
             messagebox.showinfo("提示", "请先选择一个模型", parent=self.master)
             return
 
+        # 启动时的模型仍在后台加载，此时切换会与其同时写入同一个ImageProcessor
+        if self.controller.model_loading:
+            messagebox.showinfo("提示", "模型正在加载中，请稍后再试", parent=self.master)
+            return
+
         model_path = resource_path(os.path.join("res", model_name))
         if not os.path.exists(model_path):
             messagebox.showerror("错误", f"模型文件不存在: {model_path}", parent=self.master)
@@ -1014,38 +1128,48 @@ class AdvancedPage(ttk.Frame):
             return
 
         self.model_status_var.set("正在加载...")
-        self.master.update_idletasks()
 
         # 在后台线程中加载模型，防止UI卡顿
         threading.Thread(target=self._load_model_thread, args=(model_path, model_name), daemon=True).start()
 
+    def _set_current_model(self, model_name):
+        """仅在模型名称变化时更新变量，避免重复触发界面刷新"""
+        if self.current_model_var.get() != model_name:
+            self.current_model_var.set(model_name)
+
     def _load_model_thread(self, model_path, model_name):
         """在后台线程中执行模型加载"""
         try:
             # 调用image_processor中的加载函数
             self.controller.image_processor.load_model(model_path)
+        except Exception as e:
+            logger.error(f"加载模型失败: {e}")
+            error = str(e)
+
+            def _on_failed():
+                self.model_status_var.set(f"加载失败: {error}")
+                messagebox.showerror("错误", f"加载模型失败: {error}", parent=self.master)
 
-            # 使用master.after确保UI更新在主线程中执行
-            self.master.after(0, lambda: self.current_model_var.set(model_name))
-            self.master.after(0, lambda: self.model_status_var.set("已加载"))
+            self.master.after(0, _on_failed)
+            return
 
+        def _on_loaded():
+            self._set_current_model(model_name)
+            self.model_status_var.set("已加载")
             # 保存新的模型选择到settings.json
-            self.master.after(0, self.controller._save_current_settings)
+            self.controller._save_current_settings()
+            messagebox.showinfo("成功", f"模型 {model_name} 已成功加载", parent=self.master)
 
-            self.master.after(0,
-                              lambda: messagebox.showinfo("成功", f"模型 {model_name} 已成功加载", parent=self.master))
-        except Exception as e:
-            logger.error(f"加载模型失败: {e}")
-            self.master.after(0, lambda: self.model_status_var.set(f"加载失败: {str(e)}"))
-            self.master.after(0, lambda: messagebox.showerror("错误", f"加载模型失败: {e}", parent=self.master))
+        # 所有界面更新合并为一次master.after回调，在主线程中依次执行
+        self.master.after(0, _on_loaded)
 
     def _on_tab_changed(self, event):
         current_tab_index = self.advanced_notebook.index(self.advanced_notebook.select())
         if current_tab_index == 1:  # Env Maintenance
-            if hasattr(self, 'env_canvas'):
+            if self.env_canvas is not None:
                 self.master.after(10, lambda: self.env_canvas.configure(scrollregion=self.env_canvas.bbox("all")))
         elif current_tab_index == 2:  # Software Settings
-            if hasattr(self, 'software_canvas'):
+            if self.software_canvas is not None:
                 self.master.after(10,
                                   lambda: self.software_canvas.configure(scrollregion=self.software_canvas.bbox("all")))
                 self.update_cache_size()
\ No newline at end of file
@@ -5,17 +5,41 @@ import sys
 import platform
 import logging
 import threading
+import queue
 import json
+import re
 import time
 from datetime import datetime
 import gc
 import sv_ttk
 import hashlib
 import shutil
+import stat
+import concurrent.futures
+from collections import deque
+from itertools import islice
+import numpy as np
+import torch
 from PIL import Image, ImageTk
 
-from system.config import APP_TITLE, APP_VERSION, SUPPORTED_IMAGE_EXTENSIONS
-from system.utils import resource_path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import darkdetect
+except ImportError:
+    darkdetect = None
+
+if sys.platform == 'win32':
+    import winreg
+else:
+    winreg = None
+
+from system.config import APP_TITLE, APP_VERSION, DEFAULT_EXCEL_FILENAME, PREFETCH_WORKERS, PREFETCH_DEPTH, DETECTION_BATCH_SIZE, \
+    CACHE_INTERVAL, UI_REFRESH_INTERVAL, THEME_EVENT_POLL_INTERVAL, IO_WORKERS, IO_QUEUE_DEPTH, CUDA_CACHE_RELEASE_INTERVAL
+from system.utils import resource_path, list_image_files
 from system.image_processor import ImageProcessor
 from system.metadata_extractor import ImageMetadataExtractor
 from system.data_processor import DataProcessor
@@ -29,10 +53,17 @@ from system.gui.start_page import StartPage
 from system.gui.preview_page import PreviewPage
 from system.gui.advanced_page import AdvancedPage
 from system.gui.about_page import AboutPage
-from system.gui.ui_components import InfoBar
+from system.gui.ui_components import InfoBar, derive_hover_color
 
 logger = logging.getLogger(__name__)
 
+# 清除缓存时被占用文件的重试间隔（秒），仅用于Windows
+_RM_RETRY_DELAYS = (0.05, 0.1, 0.2)
+# 系统强调色的缓存时间（秒）
+_ACCENT_COLOR_TTL = 60
+# ISO格式拍摄日期字符串的前缀
+_DT_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T')
+
 
 class ObjectDetectionGUI:
     """主应用程序窗口"""
@@ -45,16 +76,31 @@ class ObjectDetectionGUI:
         self.resume_processing = resume_processing
         self.cache_data = cache_data
         self.current_temp_photo_dir = None
+        self._temp_photo_dirs = {}
         self.is_dark_mode = False
         self.accent_color = "#0078d7"
-        import torch
+        self._accent_read_at = None
         self.cuda_available = torch.cuda.is_available()
         self.is_processing = False
         self.processing_stop_flag = threading.Event()
         self.excel_data = []
+        self._species_dirs = set()
+        self._cache_queue = None
+        self._cache_writer = None
+        self._ui_progress = None
+        self._ui_preview = None
+        # 界面刷新循环的after标识，重新开始处理前取消仍在排队的旧循环
+        self._drain_after_id = None
+        self._io_pool = None
+        self._io_futures = deque()
+        self._cache_records_size = None
         self.current_page = "settings"
         self.update_channel_var = tk.StringVar(value="稳定版 (Release)")
         self.model_var = tk.StringVar()  # <<< 新增：用于跟踪所选模型的变量
+        self._save_pending = None
+        self._last_saved_settings = None
+        # 上次应用样式时的(ttk主题, 侧边栏颜色)，未变化时不重新配置样式
+        self._last_style_signature = None
 
         self._apply_system_theme()
         self._setup_window()
@@ -71,7 +117,8 @@ class ObjectDetectionGUI:
             # 1. 从UI控件获取所有默认设置
             default_settings = self._get_current_settings()
             # 2. 保存这些默认设置到文件
-            self.settings_manager.save_settings(default_settings)
+            if self.settings_manager.save_settings(default_settings):
+                self._last_saved_settings = default_settings
             # 3. 将新创建的默认设置赋给当前实例，以确保程序后续部分能正常运行
             self.settings = default_settings
             # 4. (可选) 加载新创建的默认主题
@@ -81,12 +128,12 @@ class ObjectDetectionGUI:
         # 确保UI完全加载后再执行启动检查
         self._check_for_updates(silent=True)
 
-        if not self.image_processor.model:
+        # 模型加载完成前不允许开始处理，加载结果由_on_model_ready处理
+        self.start_page.start_stop_button["state"] = "disabled"
+        if self.model_loading:
+            self.status_bar.status_label.config(text="正在加载模型...")
+        else:
             messagebox.showerror("错误", "未找到有效的模型文件(.pt)。请在res目录中放入至少一个模型文件。")
-            if hasattr(self, 'start_page') and hasattr(self.start_page, 'start_stop_button'):
-                self.start_page.start_stop_button["state"] = "disabled"
-        if self.resume_processing and self.cache_data:
-            self.master.after(1000, self._resume_processing)
         self.setup_theme_monitoring()
         if hasattr(self, 'preview_page'):
             self.preview_page._load_validation_data()
@@ -200,13 +247,12 @@ class ObjectDetectionGUI:
 
     def _finalize_theme_change(self):
         """在主题设置后完成UI更新。"""
-        self._setup_styles()
-        self._update_ui_theme()
+        if self._setup_styles():
+            self._update_ui_theme()
         self._save_current_settings()
 
     def _apply_system_theme(self):
         try:
-            import darkdetect
             system_theme = darkdetect.theme().lower()
             if system_theme == 'dark':
                 sv_ttk.set_theme("dark")
@@ -221,11 +267,15 @@ class ObjectDetectionGUI:
             logger.warning(f"无法检测系统主题: {e}")
 
     def _detect_system_accent_color(self):
+        # 强调色很少变化，短时间内重复应用主题时直接沿用上次读取的值
+        now = time.monotonic()
+        if self._accent_read_at is not None and now - self._accent_read_at < _ACCENT_COLOR_TTL:
+            return
+        self._accent_read_at = now
         try:
             if platform.system() == "Windows":
-                import winreg
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\DWM")
-                color_dword = winreg.QueryValueEx(key, "AccentColor")[0]
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\DWM") as key:
+                    color_dword = winreg.QueryValueEx(key, "AccentColor")[0]
                 self.accent_color = f"#{color_dword & 0xFF:02x}{(color_dword >> 8) & 0xFF:02x}{(color_dword >> 16) & 0xFF:02x}"
             else:
                 self.accent_color = "#0078d7"
@@ -234,18 +284,61 @@ class ObjectDetectionGUI:
 
     def setup_theme_monitoring(self):
         if platform.system() in ["Windows", "Darwin"]:
-            self._check_theme_change()
+            try:
+                listener = darkdetect.listener
+            except AttributeError:
+                # 未安装darkdetect或旧版没有监听接口，退回定时检查
+                self._check_theme_change()
+                return
+            # 监听线程只向队列放入通知，由主线程轮询取回；线程在事件循环启动后再开始，避免跨线程调用Tk
+            self._theme_events = queue.Queue()
+            self.master.after(0, self._start_theme_listener, listener)
+
+    def _start_theme_listener(self, listener):
+        """在主线程事件循环中启动主题监听线程，并开始轮询主题变化通知"""
+        threading.Thread(target=self._theme_listener_thread, args=(listener,), daemon=True).start()
+        self._poll_theme_events()
+
+    def _theme_listener_thread(self, listener):
+        """在后台线程中等待系统主题变化通知，监听不可用时放入None通知主线程退回定时检查"""
+        try:
+            listener(self._on_theme_event)
+        except Exception as e:
+            logger.warning(f"无法监听系统主题变化，改为定时检查: {e}")
+            self._theme_events.put(None)
+
+    def _on_theme_event(self, theme):
+        """主题变化回调，运行在监听线程中，只把新主题放入队列"""
+        self._theme_events.put(str(theme).lower())
+
+    def _poll_theme_events(self):
+        """在主线程中应用最近一次主题变化；监听失败时改为定时检查"""
+        latest = None
+        while True:
+            try:
+                theme = self._theme_events.get_nowait()
+            except queue.Empty:
+                break
+            if theme is None:
+                self._check_theme_change()
+                return
+            latest = theme
+        if latest is not None:
+            self._apply_theme_change(latest)
+        self.master.after(THEME_EVENT_POLL_INTERVAL, self._poll_theme_events)
+
+    def _apply_theme_change(self, current_theme):
+        """自动主题模式下，系统主题与当前界面不一致时切换主题"""
+        if self.advanced_page.theme_var.get() != "自动":
+            return
+        if (current_theme == 'dark') != self.is_dark_mode:
+            self._apply_system_theme()
+            # 延迟最终的样式和UI更新
+            self.master.after(50, self._finalize_theme_change)
 
     def _check_theme_change(self):
         try:
-            if self.advanced_page.theme_var.get() == "自动":
-                import darkdetect
-                current_theme = darkdetect.theme().lower()
-                if (current_theme == 'dark' and not self.is_dark_mode) or \
-                        (current_theme == 'light' and self.is_dark_mode):
-                    self._apply_system_theme()
-                    # 延迟最终的样式和UI更新
-                    self.master.after(50, self._finalize_theme_change)
+            self._apply_theme_change(darkdetect.theme().lower())
         except Exception as e:
             logger.warning(f"检查主题变化失败: {e}")
         self.master.after(10000, self._check_theme_change)
@@ -256,7 +349,7 @@ class ObjectDetectionGUI:
             self.start_page.update_theme()
         if hasattr(self, 'advanced_page') and hasattr(self.advanced_page, 'update_theme'):
             self.advanced_page.update_theme()
-        self._show_page(self.current_page)
+        self._show_page(self.current_page, force=True)
 
     def _setup_window(self):
         self.master.title(APP_TITLE)
@@ -304,19 +397,61 @@ class ObjectDetectionGUI:
             if model_path:
                 logger.info(f"加载找到的第一个模型: {os.path.basename(model_path)}")
 
-        # 3. 初始化 ImageProcessor
-        self.image_processor = ImageProcessor(model_path)
+        # 3. 初始化 ImageProcessor，模型权重在后台线程中加载，窗口无需等待
+        self.image_processor = ImageProcessor()
+        # 启动时的后台加载尚未结束前为True，期间不允许在高级设置中切换模型
+        self.model_loading = bool(model_path)
         if model_path:
-            self.image_processor.model_path = model_path
             # 更新 model_var，以便UI（如下拉框）能同步显示正确的模型名称
             self.model_var.set(os.path.basename(model_path))
+            # 加载线程只把结果放入队列，由主线程轮询取回；线程在事件循环启动后再开始，避免跨线程调用Tk
+            self._model_result = queue.Queue(maxsize=1)
+            self.master.after(0, self._start_model_loading, model_path)
         else:
             # 处理未找到任何模型文件的情况
-            self.image_processor.model = None
-            self.image_processor.model_path = None
             self.model_var.set("")
             logger.error("在 res 目录中未找到任何有效的模型文件 (.pt)。")
 
+    def _start_model_loading(self, model_path):
+        """在主线程事件循环中启动模型加载线程，并开始轮询加载结果"""
+        threading.Thread(target=self._load_model_thread, args=(model_path,), daemon=True).start()
+        self._poll_model_ready()
+
+    def _load_model_thread(self, model_path):
+        """在后台线程中加载模型，结果（错误信息或None）放入队列，不直接访问Tk"""
+        error = None
+        try:
+            self.image_processor.load_model(model_path)
+        except Exception as e:
+            logger.error(f"后台加载模型失败: {e}")
+            error = str(e)
+        self._model_result.put(error)
+
+    def _poll_model_ready(self):
+        """在主线程中检查模型是否加载完成"""
+        try:
+            error = self._model_result.get_nowait()
+        except queue.Empty:
+            self.master.after(UI_REFRESH_INTERVAL, self._poll_model_ready)
+            return
+        self._on_model_ready(error)
+
+    def _on_model_ready(self, error=None):
+        """模型加载结束后启用开始按钮，并继续上次未完成的任务"""
+        self.model_loading = False
+        if error or not self.image_processor.model:
+            self.status_bar.status_label.config(text="模型加载失败")
+            messagebox.showerror("错误", error or "未找到有效的模型文件(.pt)。请在res目录中放入至少一个模型文件。")
+            return
+        # 高级设置页面在加载完成前创建，此时才能显示实际使用的模型
+        if hasattr(self, 'advanced_page'):
+            self.advanced_page._set_current_model(os.path.basename(self.image_processor.model_path))
+        if not self.is_processing:
+            self.start_page.start_stop_button["state"] = "normal"
+            self.status_bar.status_label.config(text="就绪")
+        if self.resume_processing and self.cache_data:
+            self.master.after(1000, self._resume_processing)
+
     def _find_model_file(self) -> str or None:
         try:
             res_dir = resource_path("res")
@@ -345,30 +480,30 @@ class ObjectDetectionGUI:
         self.start_page = StartPage(self.content_frame, self)
         self.advanced_page = AdvancedPage(self.content_frame, self)
         self.preview_page = PreviewPage(self.content_frame, self)
-        self.about_page = AboutPage(self.content_frame, self)
+        # 关于页面不持有任何设置，首次打开时再创建
+        self.about_page = None
 
         self.status_bar = InfoBar(self.master)
         self.status_bar.grid(row=1, column=0, columnspan=2, sticky="ew")
 
-        self._show_page("settings")
-
-        if hasattr(self, 'advanced_page') and hasattr(self.advanced_page, 'model_combobox'):
-            self.advanced_page._refresh_model_list()
+        self._show_page("settings", force=True)
 
     def _setup_styles(self):
+        """配置自定义样式，主题和强调色都未变化时直接返回False"""
         style = ttk.Style()
         sidebar_bg = self.accent_color
         sidebar_fg = "#FFFFFF"
         highlight_color = "#FFFFFF"
+        # 样式按ttk主题分别保存，切换主题后需要重新配置
+        signature = (style.theme_use(), sidebar_bg)
+        if signature == self._last_style_signature:
+            return False
+        self._last_style_signature = signature
         self.sidebar_bg = sidebar_bg
         self.sidebar_fg = sidebar_fg
         self.highlight_color = highlight_color
-        try:
-            r, g, b = self.master.winfo_rgb(sidebar_bg)
-            r, g, b = r // 257, g // 257, b // 257
-            self.sidebar_hover_bg = f"#{min(255, r + 30):02x}{min(255, g + 30):02x}{min(255, b + 30):02x}"
-        except tk.TclError:
-            self.sidebar_hover_bg = sidebar_bg
+        # 按钮悬停色由ui_components.derive_hover_color统一计算
+        self.sidebar_hover_bg = derive_hover_color(sidebar_bg)
 
         style.configure("Sidebar.TFrame", background=sidebar_bg)
         style.configure("Sidebar.TLabel", background=sidebar_bg, foreground=sidebar_fg)
@@ -380,13 +515,18 @@ class ObjectDetectionGUI:
 
         style.configure("Title.TLabel", font=("Segoe UI", 14, "bold"), padding=(0, 10, 0, 10))
         style.configure("Process.TButton", font=("Segoe UI", 11), padding=(10, 5))
+        return True
 
-    def _show_page(self, page_id: str):
+    def _show_page(self, page_id: str, force: bool = False):
+        """切换到指定页面，页面已显示时只更新按钮状态，force为True时强制重新显示"""
         self.sidebar.set_active_button(page_id)
+        if page_id == self.current_page and not force:
+            return
         self.start_page.pack_forget()
         self.preview_page.pack_forget()
         self.advanced_page.pack_forget()
-        self.about_page.pack_forget()
+        if self.about_page is not None:
+            self.about_page.pack_forget()
 
         if page_id == "settings":
             self.start_page.pack(fill="both", expand=True)
@@ -411,6 +551,8 @@ class ObjectDetectionGUI:
             self.advanced_page.pack(fill="both", expand=True)
             self.status_bar.status_label.config(text="就绪")
         elif page_id == "about":
+            if self.about_page is None:
+                self.about_page = AboutPage(self.content_frame, self)
             self.about_page.pack(fill="both", expand=True)
             self.status_bar.status_label.config(text="就绪")
 
@@ -426,26 +568,41 @@ class ObjectDetectionGUI:
         self.preview_page.file_listbox.bind("<<ListboxSelect>>", self.preview_page.on_file_selected)
         self.preview_page.image_label.bind("<Double-1>", self.preview_page.on_image_double_click)
         self.preview_page.show_detection_var.trace("w", self.preview_page.toggle_detection_preview)
-        self.start_page.save_detect_image_var.trace("w", lambda *args: self._save_current_settings())
-        self.start_page.output_excel_var.trace("w", lambda *args: self._save_current_settings())
-        self.start_page.copy_img_var.trace("w", lambda *args: self._save_current_settings())
-        self.advanced_page.controller.use_fp16_var.trace("w", lambda *args: self._save_current_settings())
-        self.advanced_page.controller.iou_var.trace("w", lambda *args: self._save_current_settings())
-        self.advanced_page.controller.conf_var.trace("w", lambda *args: self._save_current_settings())
-        self.advanced_page.controller.use_augment_var.trace("w", lambda *args: self._save_current_settings())
-        self.advanced_page.controller.use_agnostic_nms_var.trace("w", lambda *args: self._save_current_settings())
-        self.update_channel_var.trace("w", lambda *args: self._save_current_settings())
+        for var in (self.start_page.save_detect_image_var, self.start_page.output_excel_var,
+                    self.start_page.copy_img_var, self.advanced_page.controller.use_fp16_var,
+                    self.advanced_page.controller.use_tensorrt_var, self.advanced_page.controller.use_int8_var,
+                    self.advanced_page.controller.iou_var, self.advanced_page.controller.conf_var,
+                    self.advanced_page.controller.use_augment_var,
+                    self.advanced_page.controller.use_agnostic_nms_var, self.update_channel_var):
+            var.trace("w", lambda *args: self._schedule_save())
+
+    def _schedule_save(self):
+        """延迟保存设置，拖动滑块等连续修改只在停止后写入一次"""
+        if self._save_pending:
+            self.master.after_cancel(self._save_pending)
+        self._save_pending = self.master.after(400, self._flush_save)
+
+    def _flush_save(self):
+        """执行已排队的设置保存"""
+        self._save_pending = None
+        self._save_current_settings()
 
     def _save_current_settings(self):
         if not self.settings_manager: return
         settings = self._get_current_settings()
-        if self.settings_manager.save_settings(settings): logger.info("设置已保存")
+        # 设置与上次写入的内容相同时无需再次写入文件
+        if settings == self._last_saved_settings: return
+        if self.settings_manager.save_settings(settings):
+            self._last_saved_settings = settings
+            logger.info("设置已保存")
 
     def _get_current_settings(self):
         return {"file_path": self.start_page.file_path_entry.get(), "save_path": self.start_page.save_path_entry.get(),
                 "save_detect_image": self.start_page.save_detect_image_var.get(),
                 "output_excel": self.start_page.output_excel_var.get(), "copy_img": self.start_page.copy_img_var.get(),
                 "use_fp16": self.advanced_page.controller.use_fp16_var.get(),
+                "use_tensorrt": self.advanced_page.controller.use_tensorrt_var.get(),
+                "use_int8": self.advanced_page.controller.use_int8_var.get(),
                 "iou": self.advanced_page.controller.iou_var.get(),
                 "conf": self.advanced_page.controller.conf_var.get(),
                 "use_augment": self.advanced_page.controller.use_augment_var.get(),
@@ -477,6 +634,8 @@ class ObjectDetectionGUI:
             self.start_page.output_excel_var.set(settings.get("output_excel", True))
             self.start_page.copy_img_var.set(settings.get("copy_img", False))
             self.advanced_page.controller.use_fp16_var.set(settings.get("use_fp16", False))
+            self.advanced_page.controller.use_tensorrt_var.set(settings.get("use_tensorrt", False))
+            self.advanced_page.controller.use_int8_var.set(settings.get("use_int8", False))
             iou_value = settings.get("iou", 0.3)
             conf_value = settings.get("conf", 0.25)
             self.advanced_page.controller.iou_var.set(iou_value)
@@ -522,7 +681,10 @@ class ObjectDetectionGUI:
         if self.is_processing:
             if not messagebox.askyesno("确认退出", "图像处理正在进行中，确定要退出吗？"): return
             self.processing_stop_flag.set()
-        if hasattr(self, 'preview_page'): self.preview_page._save_validation_data()
+        self.preview_page._save_validation_data()
+        if self._save_pending:
+            self.master.after_cancel(self._save_pending)
+            self._save_pending = None
         self._save_current_settings()
         self.master.destroy()
 
@@ -555,7 +717,7 @@ class ObjectDetectionGUI:
             self.status_bar.status_label.config(text=f"文件路径已设置，找到 {file_count} 个图像文件。")
             self._save_current_settings()
             if self.current_page == "preview":
-                self._show_page("preview")
+                self._show_page("preview", force=True)
         else:
             messagebox.showerror("路径错误", f"提供的图像文件路径不存在或不是一个文件夹:\n'{folder_selected}'")
             self.status_bar.status_label.config(text="无效的文件路径")
@@ -608,29 +770,79 @@ class ObjectDetectionGUI:
     def get_temp_photo_dir(self, update=False):
         source_path = self.start_page.file_path_entry.get()
         if not source_path: return None
-        path_hash = hashlib.md5(source_path.encode()).hexdigest()
-        base_dir = self.settings_manager.base_dir
-        temp_dir = os.path.join(base_dir, "temp", "photo", path_hash)
+        # 每个源文件夹的临时目录只计算和创建一次
+        temp_dir = self._temp_photo_dirs.get(source_path)
+        if temp_dir is None:
+            path_hash = hashlib.md5(source_path.encode()).hexdigest()
+            temp_dir = os.path.join(self.settings_manager.photo_dir, path_hash)
+            os.makedirs(temp_dir, exist_ok=True)
+            self._temp_photo_dirs[source_path] = temp_dir
         if update:
             self.current_temp_photo_dir = temp_dir
-        os.makedirs(temp_dir, exist_ok=True)
         return temp_dir
 
-    def clear_image_cache(self):
-        cache_dir = os.path.join(self.settings_manager.base_dir, "temp", "photo")
+    def clear_image_cache(self, on_done=None):
+        """确认后在后台线程中清空图片缓存，完成后在界面线程提示结果并调用on_done"""
+        cache_dir = self.settings_manager.photo_dir
         if messagebox.askyesno("确认清除缓存",
                                f"是否清空图片缓存？\n\n此操作将删除以下文件夹及其所有内容：\n{cache_dir}\n\n注意：这不会影响您的原始图片或已保存的结果。",
                                parent=self.master):
             if os.path.exists(cache_dir):
-                try:
-                    shutil.rmtree(cache_dir)
-                    os.makedirs(cache_dir, exist_ok=True)
-                    messagebox.showinfo("成功", "图片缓存已成功清除。", parent=self.master)
-                except Exception as e:
-                    messagebox.showerror("错误", f"清除缓存时发生错误：\n{e}", parent=self.master)
+                threading.Thread(target=self._clear_image_cache_thread, args=(cache_dir, on_done),
+                                 daemon=True).start()
             else:
                 messagebox.showinfo("提示", "缓存目录不存在，无需清除。", parent=self.master)
 
+    def _clear_image_cache_thread(self, cache_dir, on_done):
+        """删除缓存目录，界面相关的更新交回主线程执行"""
+        failed = []
+
+        def on_rm_error(func, path, _exc):
+            # Windows下只读文件无法删除，去掉只读属性后重试；被杀毒软件等短暂占用时按退避间隔再试，
+            # 其他系统上占用不会导致删除失败，只尝试一次，仍失败则记录下来
+            delays = _RM_RETRY_DELAYS if sys.platform == 'win32' else ()
+            for delay in (0,) + delays:
+                if delay:
+                    time.sleep(delay)
+                try:
+                    os.chmod(path, stat.S_IWRITE)
+                    func(path)
+                    return
+                except FileNotFoundError:
+                    return
+                except PermissionError:
+                    continue
+                except OSError:
+                    break
+            failed.append(path)
+
+        error = None
+        try:
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(cache_dir, onexc=on_rm_error)
+            else:
+                shutil.rmtree(cache_dir, onerror=on_rm_error)
+            os.makedirs(cache_dir, exist_ok=True)
+        except Exception as e:
+            error = e
+        if self.master.winfo_exists():
+            self.master.after(0, self._finish_clear_image_cache, failed, error, on_done)
+
+    def _finish_clear_image_cache(self, failed, error, on_done):
+        """在界面线程中刷新缓存状态并提示清除结果"""
+        self._temp_photo_dirs.clear()
+        self.preview_page.refresh_detected_set()
+        if error is not None:
+            messagebox.showerror("错误", f"清除缓存时发生错误：\n{error}", parent=self.master)
+        elif failed:
+            messagebox.showwarning("部分清除",
+                                   f"有 {len(failed)} 个文件无法删除，可能正被其他程序占用：\n{failed[0]}",
+                                   parent=self.master)
+        else:
+            messagebox.showinfo("成功", "图片缓存已成功清除。", parent=self.master)
+        if on_done:
+            on_done()
+
     def toggle_processing_state(self):
         if not self.is_processing:
             self.check_for_cache_and_process()
@@ -638,11 +850,13 @@ class ObjectDetectionGUI:
             self.stop_processing()
 
     def check_for_cache_and_process(self):
-        cache_file = os.path.join(self.settings_manager.settings_dir, "cache.json")
+        cache_file = self.settings_manager.cache_file
         if os.path.exists(cache_file):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
+                with open(cache_file, 'rb') as f:
+                    content = f.read()
+                # 旧版缓存的全部记录都在cache.json中，可能很大
+                cache_data = orjson.loads(content) if orjson else json.loads(content)
                 if 'processed_files' in cache_data and 'total_files' in cache_data:
                     processed = cache_data.get('processed_files', 0)
                     total = cache_data.get('total_files', 0)
@@ -677,17 +891,33 @@ class ObjectDetectionGUI:
                 self.preview_page.preview_notebook.select(self.preview_page.image_preview_tab)
 
         self._set_processing_state(True)
-        self._show_page("preview")
+        self._show_page("preview", force=True)
         if resume_from == 0:
             self.excel_data = []
             self._clear_current_validation_file()
 
+        self._ui_progress = None
+        self._ui_preview = None
+        if self._drain_after_id is not None:
+            self.master.after_cancel(self._drain_after_id)
+        self._drain_after_id = self.master.after(UI_REFRESH_INTERVAL, self._drain_ui_updates, None, None)
+        detect_params = self.get_detection_params()
+        engine_params = (self.advanced_page.controller.use_tensorrt_var.get(),
+                         self.advanced_page.controller.use_int8_var.get())
         threading.Thread(
             target=self._process_images_thread,
-            args=(file_path, save_path, save_detect_image, output_excel, copy_img, use_fp16, resume_from),
+            args=(file_path, save_path, save_detect_image, output_excel, copy_img, use_fp16, resume_from,
+                  detect_params, engine_params),
             daemon=True
         ).start()
 
+    def get_detection_params(self):
+        """在主线程中一次性读取检测参数，后台线程不再访问Tk变量"""
+        controller = self.advanced_page.controller
+        return {'use_fp16': controller.use_fp16_var.get(), 'iou': controller.iou_var.get(),
+                'conf': controller.conf_var.get(), 'augment': controller.use_augment_var.get(),
+                'agnostic_nms': controller.use_agnostic_nms_var.get()}
+
     def stop_processing(self):
         if messagebox.askyesno("停止确认", "确定要停止图像处理吗？\n处理进度将被保存，下次可以继续。"):
             self.processing_stop_flag.set()
@@ -696,92 +926,95 @@ class ObjectDetectionGUI:
             messagebox.showinfo("信息", "处理继续进行。")
 
     def _process_images_thread(self, file_path, save_path, save_detect_image, output_excel, copy_img, use_fp16,
-                               resume_from=0):
+                               resume_from, detect_params, engine_params):
         start_time = time.time()
         excel_data = [] if resume_from == 0 else self.excel_data
         processed_files = resume_from
         stopped_manually = False
         earliest_date = None
         temp_photo_dir = self.get_temp_photo_dir()
+        prefetch_pool = concurrent.futures.ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=IO_WORKERS)
+        self._io_futures = deque()
+        self._species_dirs = set()
+        if resume_from == 0:
+            # 新任务先删除上次的cache.json，避免首次保存前崩溃时把旧任务的进度与新任务的记录拼在一起
+            self._delete_processing_cache()
+        self._open_cache_records(excel_data, resume=resume_from > 0)
 
         try:
-            iou = self.advanced_page.controller.iou_var.get()
-            conf = self.advanced_page.controller.conf_var.get()
-            augment = self.advanced_page.controller.use_augment_var.get()
-            agnostic_nms = self.advanced_page.controller.use_agnostic_nms_var.get()
-            image_files = sorted([f for f in os.listdir(file_path) if f.lower().endswith(SUPPORTED_IMAGE_EXTENSIONS)])
+            iou = detect_params['iou']
+            conf = detect_params['conf']
+            augment = detect_params['augment']
+            agnostic_nms = detect_params['agnostic_nms']
+            use_tensorrt, use_int8 = engine_params
+            if use_tensorrt and not augment:
+                if self.master.winfo_exists():
+                    self.master.after(0, lambda: self.status_bar.status_label.config(text="正在准备TensorRT引擎..."))
+                self.image_processor.prepare_engine(use_fp16, int8=use_int8, calib_dir=file_path)
+            else:
+                self.image_processor.release_engine()
+            image_files = list_image_files(file_path)
             total_files = len(image_files)
+            # 大批量任务按总数的1%拉长进度保存间隔，减少等待后台保存的次数
+            cache_interval = max(CACHE_INTERVAL, total_files // 100)
+            last_checkpoint = resume_from
+            # 继续任务时跳过已处理的文件，不复制文件列表
+            image_files = islice(image_files, resume_from, None)
             if resume_from > 0:
-                image_files = image_files[resume_from:]
                 if excel_data:
-                    valid_dates = [item['拍摄日期对象'] for item in excel_data if item.get('拍摄日期对象')]
-                    if valid_dates:
-                        earliest_date = min(valid_dates)
+                    earliest_date = self._find_earliest_date(excel_data)
 
-            for idx, filename in enumerate(image_files):
+            prefetched = self._iter_prefetched(prefetch_pool, file_path, image_files)
+            next_cuda_release = processed_files + CUDA_CACHE_RELEASE_INTERVAL
+            while True:
+                batch = list(islice(prefetched, DETECTION_BATCH_SIZE))
+                if not batch:
+                    break
                 if self.processing_stop_flag.is_set():
                     stopped_manually = True
                     break
 
-                if self.master.winfo_exists():
-                    self.master.after(0, lambda f=filename: self.status_bar.status_label.config(text=f"正在处理: {f}"))
-                try:
-                    listbox_idx = self.preview_page.file_listbox.get(0, "end").index(filename)
-                    if self.master.winfo_exists():
-                        self.master.after(0, lambda i=listbox_idx: (
-                            self.preview_page.file_listbox.selection_clear(0, "end"),
-                            self.preview_page.file_listbox.selection_set(i),
-                            self.preview_page.file_listbox.see(i)
-                        ))
-                except ValueError:
-                    pass
-
                 elapsed_time = time.time() - start_time
-                speed = (processed_files - resume_from + 1) / elapsed_time if elapsed_time > 0 else 0
-                remaining_time = (total_files - (processed_files + 1)) / speed if speed > 0 else float('inf')
-
-                if self.master.winfo_exists():
-                    self.master.after(0, lambda p=processed_files + 1, t=total_files, s=speed, r=remaining_time:
-                    self.start_page.progress_frame.update_progress(value=p, total=t, speed=s, remaining_time=r))
-
-                try:
-                    img_path = os.path.join(file_path, filename)
-                    image_info, img = ImageMetadataExtractor.extract_metadata(img_path, filename)
-                    species_info = self.image_processor.detect_species(img_path, use_fp16, iou, conf, augment,
-                                                                       agnostic_nms)
-                    species_info['检测时间'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    detect_results = species_info.get('detect_results')
-                    if detect_results:
-                        self.image_processor.save_detection_temp(detect_results, filename, temp_photo_dir)
-                        self.image_processor.save_detection_info_json(detect_results, filename, species_info,
-                                                                      temp_photo_dir)
-                        if self.master.winfo_exists():
-                            self.master.after(0, lambda p=img_path, d=detect_results, info=species_info.copy(): (
-                                self.preview_page.update_image_preview(p, show_detection=True, detection_results=d),
-                                self.preview_page.update_image_info(p, os.path.basename(p)),
-                                self.preview_page._update_detection_info(info)
-                            ))
-                    if save_detect_image: self.image_processor.save_detection_result(detect_results, filename,
-                                                                                     save_path)
-                    if copy_img and img: self._copy_image_by_species(img_path, save_path,
-                                                                     species_info['物种名称'].split(','))
-                    if 'detect_results' in species_info: del species_info['detect_results']
-                    image_info.update(species_info)
-                    excel_data.append(image_info)
-                except Exception as e:
-                    logger.error(f"处理文件 {filename} 失败: {e}")
-                processed_files += 1
-                if processed_files % 10 == 0: self._save_processing_cache(excel_data, file_path, save_path,
-                                                                          save_detect_image, output_excel, copy_img,
-                                                                          use_fp16, processed_files, total_files,
-                                                                          iou, conf, augment, agnostic_nms)
-                try:
-                    del img_path, image_info, img, species_info, detect_results
-                except NameError:
-                    pass
-                gc.collect()
-
-            if not stopped_manually:
+                speed = (processed_files - resume_from + len(batch)) / elapsed_time if elapsed_time > 0 else 0
+                remaining_time = (total_files - (processed_files + len(batch))) / speed if speed > 0 else float('inf')
+                self._ui_progress = (batch[0][0], processed_files + len(batch), total_files, speed, remaining_time)
+
+                loaded = [prefetch.result() for _, prefetch in batch]
+                batch_species = self._detect_batch(loaded, use_fp16, iou, conf, augment, agnostic_nms)
+
+                for (filename, _), (img_path, image_info, pixels), species_info in zip(batch, loaded,
+                                                                                      batch_species):
+                    try:
+                        if isinstance(species_info, Exception):
+                            raise species_info
+                        self._handle_detection_result(filename, img_path, image_info, pixels is not None,
+                                                      species_info, excel_data, temp_photo_dir, save_path,
+                                                      save_detect_image, copy_img)
+                    except Exception as e:
+                        logger.error(f"处理文件 {filename} 失败: {e}")
+                    processed_files += 1
+                    if processed_files - last_checkpoint >= cache_interval:
+                        self._save_processing_cache(file_path, save_path, save_detect_image, output_excel,
+                                                    copy_img, use_fp16, processed_files, total_files, iou, conf,
+                                                    augment, agnostic_nms)
+                        last_checkpoint = processed_files
+                # 引用计数已在del时释放本批图像，完整的循环回收只需与显存归还一起定期执行
+                del batch, loaded, batch_species
+                if processed_files >= next_cuda_release:
+                    gc.collect()
+                    self.image_processor.release_cuda_cache()
+                    next_cuda_release = processed_files + CUDA_CACHE_RELEASE_INTERVAL
+
+            self._wait_for_io()
+            self._ui_progress = None
+            if stopped_manually:
+                # 进度保存间隔较大，停止时补存一次，避免下次继续时重复处理；进度未变化时无需重写
+                if processed_files != last_checkpoint:
+                    self._save_processing_cache(file_path, save_path, save_detect_image, output_excel, copy_img,
+                                                use_fp16, processed_files, total_files, iou, conf, augment,
+                                                agnostic_nms)
+            else:
                 if self.master.winfo_exists():
                     self.master.after(0, lambda: self.start_page.progress_frame.update_progress(value=total_files,
                                                                                                 total=total_files,
@@ -798,9 +1031,128 @@ class ObjectDetectionGUI:
             logger.error(f"处理过程中发生错误: {e}")
             messagebox.showerror("错误", f"处理过程中发生错误: {e}")
         finally:
+            prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._io_pool.shutdown(wait=True)
+            self._close_cache_records()
             if self.master.winfo_exists():
                 self._set_processing_state(False)
-            gc.collect()
+
+    @staticmethod
+    def _find_earliest_date(excel_data):
+        """将ISO日期字符串装入NumPy数组，在C层一次归约出最早的拍摄日期"""
+        dates = np.fromiter((item['拍摄日期对象'] for item in excel_data if item.get('拍摄日期对象')), dtype='<U32')
+        # 字符串数组用argmin归约，兼容不支持字符串minimum的NumPy 1.x
+        return str(dates[dates.argmin()]) if dates.size else None
+
+    def _detect_batch(self, loaded, use_fp16, iou, conf, augment, agnostic_nms):
+        """对一批已预读的图像执行检测，未能解码的图像和批量检测失败时逐张检测，失败项以异常对象占位"""
+        batch_species = [None] * len(loaded)
+        decoded = [i for i, (_, _, pixels) in enumerate(loaded) if pixels is not None]
+        if decoded:
+            try:
+                results = self.image_processor.detect_species_batch([loaded[i][2] for i in decoded], use_fp16, iou,
+                                                                    conf, augment, agnostic_nms)
+                for i, species_info in zip(decoded, results):
+                    batch_species[i] = species_info
+            except Exception as e:
+                logger.warning(f"批量检测失败，改为逐张检测: {e}")
+
+        for i, (img_path, _, pixels) in enumerate(loaded):
+            if batch_species[i] is not None:
+                continue
+            if pixels is None:
+                logger.warning(f"图像未能预先解码，改为按路径单独检测: {img_path}")
+            try:
+                batch_species[i] = self.image_processor.detect_species(img_path, use_fp16, iou, conf, augment,
+                                                                       agnostic_nms, image=pixels)
+            except Exception as e:
+                batch_species[i] = e
+        return batch_species
+
+    def _handle_detection_result(self, filename, img_path, image_info, readable, species_info, excel_data,
+                                 temp_photo_dir, save_path, save_detect_image, copy_img):
+        """保存单张图像的检测结果、更新预览并记录到Excel数据"""
+        species_info['检测时间'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        detect_results = species_info.get('detect_results')
+        if detect_results:
+            self._submit_io(self._save_detection_temp_files, detect_results, filename, species_info.copy(),
+                            temp_photo_dir)
+            self._ui_preview = (img_path, detect_results, species_info.copy())
+        if save_detect_image: self._submit_io(self.image_processor.save_detection_result, detect_results, filename,
+                                              save_path)
+        if copy_img and readable: self._submit_io(self._copy_image_by_species, img_path, save_path,
+                                             species_info['物种名称'].split(','))
+        if 'detect_results' in species_info: del species_info['detect_results']
+        image_info.update(species_info)
+        excel_data.append(image_info)
+        self._append_cache_record(image_info)
+
+    def _save_detection_temp_files(self, detect_results, filename, species_info, temp_photo_dir):
+        """在IO线程中保存检测预览图和检测信息，写完后再标记为已检测"""
+        self.image_processor.save_detection_temp(detect_results, filename, temp_photo_dir)
+        self.image_processor.save_detection_info_json(detect_results, filename, species_info, temp_photo_dir)
+        self.preview_page.mark_detected(filename)
+
+    def _submit_io(self, fn, *args):
+        """将结果保存交给IO线程池，未完成的任务超过上限时等待最早的任务，限制占用的内存"""
+        self._io_futures.append(self._io_pool.submit(fn, *args))
+        while len(self._io_futures) > IO_QUEUE_DEPTH:
+            self._check_io_future(self._io_futures.popleft())
+
+    def _wait_for_io(self):
+        """等待所有已提交的结果保存任务完成"""
+        while self._io_futures:
+            self._check_io_future(self._io_futures.popleft())
+
+    @staticmethod
+    def _check_io_future(future):
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"保存处理结果失败: {e}")
+
+    def _drain_ui_updates(self, applied_progress, applied_preview):
+        """在主线程中定时应用处理线程最近一次提交的进度和预览，多次提交只刷新一次界面"""
+        progress, preview = self._ui_progress, self._ui_preview
+        if progress is not None and progress is not applied_progress:
+            filename, value, total, speed, remaining_time = progress
+            self.status_bar.status_label.config(text=f"正在处理: {filename}")
+            self._select_processing_file(filename)
+            self.start_page.progress_frame.update_progress(value=value, total=total, speed=speed,
+                                                           remaining_time=remaining_time)
+        if preview is not None and preview is not applied_preview:
+            self.preview_page.show_processing_preview(*preview)
+        if self.is_processing:
+            self._drain_after_id = self.master.after(UI_REFRESH_INTERVAL, self._drain_ui_updates, progress, preview)
+        else:
+            self._drain_after_id = None
+
+    def _select_processing_file(self, filename):
+        listbox_idx = self.preview_page.get_file_index(filename)
+        if listbox_idx is None:
+            return
+        listbox = self.preview_page.file_listbox
+        listbox.selection_clear(0, "end")
+        listbox.selection_set(listbox_idx)
+        listbox.see(listbox_idx)
+
+    def _iter_prefetched(self, executor, file_path, image_files):
+        """按顺序产出文件名及其预读任务，检测当前图像时后台提前读取后续图像"""
+        pending = deque()
+        for filename in image_files:
+            pending.append((filename, executor.submit(self._prefetch_image, file_path, filename)))
+            if len(pending) > PREFETCH_DEPTH:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+    @staticmethod
+    def _prefetch_image(file_path, filename):
+        """在后台线程中读取单张图像的元数据并解码像素"""
+        img_path = os.path.join(file_path, filename)
+        image_info = ImageMetadataExtractor.extract_metadata_only(img_path, filename)
+        pixels = ImageProcessor.read_image(img_path)
+        return img_path, image_info, pixels
 
     def _set_processing_state(self, is_processing: bool):
         self.is_processing = is_processing
@@ -825,61 +1177,177 @@ class ObjectDetectionGUI:
         return True
 
     def _copy_image_by_species(self, img_path: str, save_path: str, species_names: list):
+        """按物种复制原图，copyfile在Linux上走内核零拷贝，目录在本次处理中只创建一次"""
+        file_name = os.path.basename(img_path)
         for name in species_names:
             if name:
                 to_path = os.path.join(save_path, name)
-                os.makedirs(to_path, exist_ok=True)
-                from shutil import copy
-                copy(img_path, to_path)
+                if to_path not in self._species_dirs:
+                    os.makedirs(to_path, exist_ok=True)
+                    self._species_dirs.add(to_path)
+                shutil.copyfile(img_path, os.path.join(to_path, file_name))
 
     def _export_and_open_excel(self, excel_data, save_path):
-        from system.config import DEFAULT_EXCEL_FILENAME
         output_file_path = os.path.join(save_path, DEFAULT_EXCEL_FILENAME)
-        if DataProcessor.export_to_excel(excel_data, output_file_path):
-            if messagebox.askyesno("成功", f"数据已导出到 {output_file_path}\n是否立即打开?"):
-                try:
-                    os.startfile(output_file_path)
-                except Exception as e:
-                    messagebox.showerror("错误", f"无法打开文件: {e}")
+        if DataProcessor.export_to_excel(excel_data, output_file_path) and self.master.winfo_exists():
+            # 导出在处理线程中完成，对话框交回界面线程显示
+            self.master.after(0, self._ask_open_excel, output_file_path)
+
+    def _ask_open_excel(self, output_file_path):
+        if messagebox.askyesno("成功", f"数据已导出到 {output_file_path}\n是否立即打开?"):
+            try:
+                os.startfile(output_file_path)
+            except Exception as e:
+                messagebox.showerror("错误", f"无法打开文件: {e}")
 
-    def _save_processing_cache(self, excel_data, file_path, save_path, save_detect_image, output_excel, copy_img,
+    def _save_processing_cache(self, file_path, save_path, save_detect_image, output_excel, copy_img,
                                use_fp16, processed_files, total_files, iou, conf, use_augment, use_agnostic_nms):
-        def make_serializable(obj):
-            if isinstance(obj, datetime): return obj.isoformat()
-            if isinstance(obj, dict): return {k: make_serializable(v) for k, v in obj.items() if k != 'detect_results'}
-            if isinstance(obj, list): return [make_serializable(i) for i in obj]
-            if hasattr(obj, '__dict__'): return None
-            return obj
-
-        serializable_excel_data = make_serializable(excel_data)
+        """将任务进度交给缓存写入线程，由其在已入队的记录落盘后写入"""
+        if self._cache_queue is None:
+            return
+        # 进度之前的图像结果须已保存，继续任务时才不会遗漏
+        self._wait_for_io()
         cache_data = {'file_path': file_path, 'save_path': save_path, 'save_detect_image': save_detect_image,
                       'output_excel': output_excel, 'copy_img': copy_img, 'use_fp16': use_fp16,
                       'processed_files': processed_files, 'total_files': total_files,
-                      'excel_data': serializable_excel_data,
                       'iou': iou,
                       'conf': conf,
                       'use_augment': use_augment,
                       'use_agnostic_nms': use_agnostic_nms}
-        cache_file = os.path.join(self.settings_manager.settings_dir, "cache.json")
+        self._cache_queue.put(('checkpoint', cache_data))
+
+    def _write_cache_meta(self, cache_data):
+        cache_file = self.settings_manager.cache_file
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=4)
+            if orjson:
+                buf = orjson.dumps(cache_data, option=orjson.OPT_INDENT_2, default=self._serialize_cache_value)
+            else:
+                buf = json.dumps(cache_data, ensure_ascii=False, indent=4,
+                                 default=self._serialize_cache_value).encode('utf-8')
+            # 先写临时文件再替换，中途中断不会留下半截的缓存文件
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(buf)
+            os.replace(tmp_file, cache_file)
         except Exception as e:
             logger.error(f"保存缓存失败: {e}")
 
     def _delete_processing_cache(self):
-        cache_file = os.path.join(self.settings_manager.settings_dir, "cache.json")
-        if os.path.exists(cache_file): os.remove(cache_file)
+        self._close_cache_records()
+        # 直接删除，文件不存在时忽略，省去一次存在性检查
+        for path in (self.settings_manager.cache_file, self.settings_manager.cache_records_file):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"删除处理缓存失败: {e}")
+
+    def _open_cache_records(self, excel_data, resume):
+        """打开缓存记录文件并启动写入线程；继续任务时截断到上次落盘的位置，否则重写已有记录"""
+        records_file = self.settings_manager.cache_records_file
+        try:
+            if resume and self._cache_records_size is not None and os.path.exists(records_file):
+                cache_fp = open(records_file, 'r+b', buffering=1 << 20)
+                cache_fp.truncate(self._cache_records_size)
+                cache_fp.seek(0, os.SEEK_END)
+                excel_data = []
+            else:
+                cache_fp = open(records_file, 'wb', buffering=1 << 20)
+        except OSError as e:
+            logger.error(f"打开缓存记录文件失败: {e}")
+            return
+
+        self._cache_queue = queue.Queue()
+        self._cache_writer = threading.Thread(target=self._cache_writer_loop, args=(cache_fp, self._cache_queue),
+                                              daemon=True)
+        self._cache_writer.start()
+        if resume:
+            for record in excel_data:
+                self._append_cache_record(record)
+
+    def _append_cache_record(self, record):
+        """将一条处理结果的副本交给缓存写入线程，处理线程不等待磁盘"""
+        # detect_results在加入结果列表前已移除，这里只需浅拷贝，避免逐键比较
+        if self._cache_queue is not None:
+            self._cache_queue.put(('record', dict(record)))
+
+    def _close_cache_records(self):
+        """通知写入线程写完队列中剩余的数据并关闭文件"""
+        if self._cache_queue is not None:
+            self._cache_queue.put(None)
+            self._cache_writer.join()
+            self._cache_queue = None
+            self._cache_writer = None
+
+    def _cache_writer_loop(self, cache_fp, cache_queue):
+        """缓存写入线程：逐行追加记录；收到进度时先刷新记录并fsync，再写入带有效字节长度的进度"""
+        with cache_fp:
+            while True:
+                item = cache_queue.get()
+                if item is None:
+                    break
+                kind, data = item
+                try:
+                    if kind == 'record':
+                        if orjson:
+                            line = orjson.dumps(data, default=self._serialize_cache_value)
+                        else:
+                            line = json.dumps(data, ensure_ascii=False,
+                                              default=self._serialize_cache_value).encode('utf-8')
+                        cache_fp.write(line + b"\n")
+                    else:
+                        cache_fp.flush()
+                        os.fsync(cache_fp.fileno())
+                        if hasattr(os, 'posix_fadvise'):
+                            # 已落盘的缓存页不再需要，主动释放，避免挤出待读取图像的页缓存
+                            os.posix_fadvise(cache_fp.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                        data['cached_records_size'] = cache_fp.tell()
+                        self._write_cache_meta(data)
+                except (TypeError, ValueError, OSError) as e:
+                    logger.error(f"写入缓存失败: {e}")
+
+    @staticmethod
+    def _serialize_cache_value(obj):
+        """日期转为ISO字符串，其余无法序列化的对象记为None"""
+        if isinstance(obj, datetime): return obj.isoformat()
+        return None
+
+    def _read_cache_records(self, size):
+        """读取缓存记录文件中前size字节内的记录，逐行解析，损坏的行记录日志后跳过"""
+        records = []
+        try:
+            with open(self.settings_manager.cache_records_file, 'rb') as f:
+                data = f.read(size)
+        except OSError as e:
+            logger.error(f"读取缓存记录失败: {e}")
+            return records
+        for line_no, line in enumerate(data.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(self._deserialize_record(orjson.loads(line) if orjson else json.loads(line)))
+            except ValueError as e:
+                logger.error(f"缓存记录第 {line_no} 行解析失败，已跳过: {e}")
+        return records
 
     def _load_cache_data_from_file(self, cache_data):
         self._load_settings_to_ui(cache_data)
-        self.excel_data = cache_data.get('excel_data', [])
-        for item in self.excel_data:
-            if '拍摄日期对象' in item and isinstance(item['拍摄日期对象'], str):
-                try:
-                    item['拍摄日期对象'] = datetime.fromisoformat(item['拍摄日期对象'])
-                except ValueError:
-                    item['拍摄日期对象'] = None
+        if 'excel_data' in cache_data:
+            # 旧版缓存将全部记录保存在cache.json中
+            self.excel_data = [self._deserialize_record(item) for item in cache_data.get('excel_data', [])]
+            self._cache_records_size = None
+        else:
+            self._cache_records_size = cache_data.get('cached_records_size', 0)
+            self.excel_data = self._read_cache_records(self._cache_records_size)
+
+    @staticmethod
+    def _deserialize_record(item):
+        """校验缓存记录中的拍摄日期，拍摄日期在内存中保持ISO字符串，不是日期的值记为None"""
+        value = item.get('拍摄日期对象')
+        if isinstance(value, str) and not _DT_RE.match(value):
+            item['拍摄日期对象'] = None
+        return item
 
     def _resume_processing(self):
         self._load_cache_data_from_file(self.cache_data)
@@ -897,5 +1365,4 @@ class ObjectDetectionGUI:
                 except Exception as e:
                     logger.error(f"清除旧的校验文件失败: {e}")
         # 同时清除内存中的数据
-        if hasattr(self, 'preview_page'):
-            self.preview_page.validation_data.clear()
\ No newline at end of file
+        self.preview_page.validation_data.clear()
\ No newline at end of file
@@ -4,11 +4,28 @@ from PIL import Image, ImageTk
 import os
 import json
 import logging
-import cv2
 import threading
 import re
-
-from system.config import NORMAL_FONT, SUPPORTED_IMAGE_EXTENSIONS
+import shutil
+import concurrent.futures
+from collections import OrderedDict
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+except Exception:  # 未安装PyTurboJPEG或找不到libjpeg-turbo动态库
+    _turbo_jpeg = None
+
+from system.config import NORMAL_FONT, PREVIEW_CACHE_SIZE
+from system.utils import list_image_files
+from system.image_processor import ImageProcessor
+from system.metadata_extractor import ImageMetadataExtractor
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +45,25 @@ class PreviewPage(ttk.Frame):
         self.current_detection_results = None
         self.active_keybinds = []
         self._is_navigating = False  
+        # 各图像标签待执行的缩放任务，用于合并连续的尺寸变化事件
+        self._pending_resize = {}
+        # 尺寸稳定后的高质量重绘任务
+        self._settle_resize = {}
+        # 在后台线程中读取预览图像和元数据，序号用于丢弃已切换文件的过期结果
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._preview_gen = 0
+        self._suppress_toggle = False
+        self._screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+        # 最近解码的预览图，键为(路径, 修改时间)，文件被重新写入后自动失效
+        self._decoded_cache = OrderedDict()
+        self._decoded_cache_lock = threading.Lock()
+        # 临时目录中已有检测结果（结果图和JSON均存在）的文件名
+        self._detected_set = set()
+        # 上次扫描的(临时目录, 目录修改时间)，目录未变化时跳过重新扫描
+        self._detected_scan_key = None
+        self._file_index = {}
+        # 已解析的检测JSON，键为路径，值为(修改时间, 内容)
+        self._json_cache = {}
 
         self._create_widgets()
         self.rebind_keys()
@@ -48,10 +84,16 @@ class PreviewPage(ttk.Frame):
     def clear_previews(self):
         """Clears content from all preview tabs to reset the state."""
         # Clear image preview tab
+        self._preview_gen += 1  # 丢弃尚未返回的后台预览结果
+        self._json_cache.clear()
+        with self._decoded_cache_lock:
+            self._decoded_cache.clear()
         self.file_listbox.delete(0, tk.END)
+        self._file_index = {}
         self.image_label.config(image='', text="请从左侧列表选择图像")
-        if hasattr(self.image_label, 'image'):
-            self.image_label.image = None
+        self.image_label.image = None
+        # 同时释放保留的原图，无需等待垃圾回收
+        self.original_image = None
         self.info_text.config(state="normal")
         self.info_text.delete(1.0, tk.END)
         self.info_text.config(state="disabled")
@@ -62,8 +104,8 @@ class PreviewPage(ttk.Frame):
         # Clear validation check tab
         self.validation_listbox.delete(0, tk.END)
         self.validation_image_label.config(image='', text="请从左侧列表选择处理后的图像")
-        if hasattr(self.validation_image_label, 'image'):
-            self.validation_image_label.image = None
+        self.validation_image_label.image = None
+        self.validation_original_image = None
         self.validation_info_text.config(state="normal")
         self.validation_info_text.delete(1.0, tk.END)
         self.validation_info_text.config(state="disabled")
@@ -288,12 +330,41 @@ class PreviewPage(ttk.Frame):
             return
 
         try:
-            image_files = [f for f in os.listdir(directory) if f.lower().endswith(SUPPORTED_IMAGE_EXTENSIONS)]
-            image_files.sort()
-            for file in image_files:
-                self.file_listbox.insert(tk.END, file)
+            image_files = list_image_files(directory)
+            if image_files:
+                # 一次性插入全部文件名，只触发一次Tcl调用和列表重绘
+                self.file_listbox.insert(tk.END, *image_files)
+            self._file_index = {name: i for i, name in enumerate(image_files)}
         except Exception as e:
             logger.error(f"更新文件列表失败: {e}")
+        self.refresh_detected_set()
+
+    def get_file_index(self, file_name):
+        """返回文件在列表中的位置，不在列表中时返回None"""
+        return self._file_index.get(file_name)
+
+    def refresh_detected_set(self):
+        """扫描一次临时目录，记录已有检测结果的文件，避免每次选择时检查文件是否存在"""
+        photo_path = self.controller.get_temp_photo_dir()
+        names = set()
+        if photo_path:
+            try:
+                scan_key = (photo_path, os.stat(photo_path).st_mtime_ns)
+                if scan_key == self._detected_scan_key:
+                    return
+                self._detected_scan_key = scan_key
+                with os.scandir(photo_path) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError as e:
+                self._detected_scan_key = None
+                logger.error(f"扫描检测结果目录失败: {e}")
+        else:
+            self._detected_scan_key = None
+        self._detected_set = {name for name in names if f"{os.path.splitext(name)[0]}.json" in names}
+
+    def mark_detected(self, file_name):
+        """记录新保存了检测结果的文件"""
+        self._detected_set.add(file_name)
 
     def on_file_selected(self, event):
         selection = self.file_listbox.curselection()
@@ -307,69 +378,193 @@ class PreviewPage(ttk.Frame):
         self.current_image_path = file_path
         self.current_detection_results = None
 
-        self.update_image_info(file_path, file_name)
-
         photo_path = self.controller.get_temp_photo_dir()
-        if not photo_path: return
+        label_size = (self.image_label.winfo_width(), self.image_label.winfo_height())
+
+        self._preview_gen += 1
+        future = self._io_pool.submit(self._load_preview_data, file_path, file_name, photo_path, label_size)
+        future.add_done_callback(
+            lambda f, gen=self._preview_gen: self.master.after(0, self._apply_preview, gen, f))
+
+    def _load_preview_data(self, file_path, file_name, photo_path, label_size):
+        """在后台线程中读取图像元数据、预览图和检测信息"""
+        image_info = ImageMetadataExtractor.extract_metadata_only(file_path, file_name)
+        data = {
+            "image_info": image_info,
+            "size_text": "",
+            "image": None,
+            "thumb": None,
+            "is_temp_result": False,
+            "detection_info": None,
+            "preview_failed": False
+        }
+        if not photo_path:
+            data["size_text"] = self._get_size_text(file_path)
+            return data
 
         temp_result_path = os.path.join(photo_path, file_name)
         base_name, _ = os.path.splitext(file_name)
         json_path = os.path.join(photo_path, f"{base_name}.json")
 
-        if os.path.exists(temp_result_path) and os.path.exists(json_path):
-            self.show_detection_var.set(True)
-            self.update_image_preview(temp_result_path, is_temp_result=True)
+        preview_path = file_path
+        if file_name in self._detected_set:
+            data["is_temp_result"] = True
+            preview_path = temp_result_path
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    detection_info = json.load(f)
-                self._update_detection_info(detection_info)
+                data["detection_info"] = self._read_detection_json(json_path)
+            except FileNotFoundError:
+                # 检测结果已被外部删除，回退为显示原图
+                self._detected_set.discard(file_name)
+                data["is_temp_result"] = False
+                preview_path = file_path
             except Exception as e:
                 logger.error(f"读取检测JSON失败: {e}")
+
+        original_size = (None, None)
+        try:
+            img, size = self._open_for_preview(preview_path)
+            if preview_path == file_path:
+                # 预览的就是原图时直接复用其尺寸，无需再次打开文件
+                original_size = size
+            data["image"] = img
+            data["thumb"] = self._resize_image_to_fit(img, *label_size)
+        except Exception as e:
+            logger.error(f"更新图像预览失败: {e}")
+            data["preview_failed"] = True
+        data["size_text"] = self._get_size_text(file_path, *original_size)
+        return data
+
+    def _read_detection_json(self, json_path):
+        """读取检测结果JSON，文件未修改时直接返回缓存的解析结果"""
+        mtime = os.path.getmtime(json_path)
+        cached = self._json_cache.get(json_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(json_path, 'rb') as f:
+            content = f.read()
+        detection_info = orjson.loads(content) if orjson else json.loads(content)
+        self._json_cache[json_path] = (mtime, detection_info)
+        return detection_info
+
+    def _apply_preview(self, generation, future):
+        """在主线程中显示后台加载的结果，忽略已过期的结果"""
+        if generation != self._preview_gen or not self.winfo_exists():
+            return
+        try:
+            data = future.result()
+        except Exception as e:
+            logger.error(f"加载图像信息失败: {e}")
+            return
+
+        self._show_image_info(data["image_info"], data["size_text"])
+
+        if data["preview_failed"]:
+            self.image_label.config(image='', text="无法加载图像")
+            self.image_label.image = None
+            self.original_image = None
+        elif data["image"] is not None:
+            # 直接显示已加载的图像，避免变量跟踪回调再次同步读取
+            self._suppress_toggle = True
+            try:
+                self.show_detection_var.set(data["is_temp_result"])
+            finally:
+                self._suppress_toggle = False
+            self.original_image = data["image"]
+            self._set_label_photo(self.image_label, data["thumb"])
+            if data["detection_info"] is not None:
+                self._update_detection_info(data["detection_info"])
+
+    @staticmethod
+    def _set_label_photo(label, img):
+        """在标签中显示图像，尺寸与当前图像相同时直接写入原有PhotoImage，不再新建Tk图像"""
+        photo = getattr(label, 'image', None)
+        if photo is not None and (photo.width(), photo.height()) == img.size:
+            photo.paste(img)
         else:
-            self.show_detection_var.set(False)
-            self.update_image_preview(file_path)
+            photo = ImageTk.PhotoImage(img)
+            label.image = photo
+        label.config(image=photo)
 
     def update_image_preview(self, file_path: str, show_detection: bool = False, detection_results=None,
                              is_temp_result: bool = False):
-        if hasattr(self.image_label, 'image'):
-            self.image_label.image = None
-
+        """在后台线程中解码并缩放预览图，完成后在主线程显示"""
+        label_size = (self.image_label.winfo_width(), self.image_label.winfo_height())
+        self._preview_gen += 1
+        future = self._io_pool.submit(self._decode_preview, file_path, show_detection, detection_results,
+                                      is_temp_result, label_size)
+        future.add_done_callback(
+            lambda f, gen=self._preview_gen: self.master.after(0, self._apply_image_preview, gen, f))
+
+    def show_processing_preview(self, img_path, detection_results, species_info):
+        """批量处理时显示当前图像的检测结果，绘制、缩放和元数据读取都在后台线程完成"""
+        label_size = (self.image_label.winfo_width(), self.image_label.winfo_height())
+        self._preview_gen += 1
+        future = self._io_pool.submit(self._load_processing_preview, img_path, detection_results, label_size)
+        future.add_done_callback(
+            lambda f, gen=self._preview_gen: self.master.after(0, self._apply_image_preview, gen, f,
+                                                               species_info))
+
+    def _decode_preview(self, file_path, show_detection, detection_results, is_temp_result, label_size):
+        """在后台线程中生成预览图，返回(缓存图像, 原图尺寸, 适应标签的缩略图)"""
+        if show_detection and detection_results and not is_temp_result:
+            img = ImageProcessor.plot_to_image(detection_results[0])
+            size = img.size
+            img = self._reduce_to_screen(img)
+        else:
+            img, size = self._open_for_preview(file_path)
+        # 临时结果图可能已被压缩，尺寸不可用
+        return img, None if is_temp_result else size, self._resize_image_to_fit(img, *label_size)
+
+    def _load_processing_preview(self, img_path, detection_results, label_size):
+        """在后台线程中生成检测结果预览图，并读取图像信息"""
+        img, size, thumb = self._decode_preview(img_path, True, detection_results, False, label_size)
+        image_info = ImageMetadataExtractor.extract_metadata_only(img_path, os.path.basename(img_path))
+        return img, size, thumb, image_info, self._get_size_text(img_path, *size)
+
+    def _apply_image_preview(self, generation, future, species_info=None):
+        """在主线程中显示后台生成的预览图，忽略已过期的结果"""
+        if generation != self._preview_gen or not self.winfo_exists():
+            return
         try:
-            if is_temp_result:
-                img = Image.open(file_path)
-            elif show_detection and detection_results:
-                result_img = detection_results[0].plot()
-                img = Image.fromarray(cv2.cvtColor(result_img, cv2.COLOR_BGR2RGB))
-            else:
-                img = Image.open(file_path)
-            self.original_image = img
-            resized_img = self._resize_image_to_fit(img, self.image_label.winfo_width(),
-                                                    self.image_label.winfo_height())
-            photo = ImageTk.PhotoImage(resized_img)
-            self.image_label.config(image=photo)
-            self.image_label.image = photo
+            result = future.result()
         except Exception as e:
             logger.error(f"更新图像预览失败: {e}")
             self.image_label.config(image='', text="无法加载图像")
+            self.image_label.image = None
             self.original_image = None
+            return
 
-    def update_image_info(self, file_path: str, file_name: str):
-        from system.metadata_extractor import ImageMetadataExtractor
-        image_info, _ = ImageMetadataExtractor.extract_metadata(file_path, file_name)
+        img, _, thumb = result[:3]
+        if species_info is not None:
+            self._show_image_info(*result[3:])
+        self.original_image = img
+        self._set_label_photo(self.image_label, thumb)
+        if species_info is not None:
+            self._update_detection_info(species_info)
+
+    def _get_size_text(self, file_path, width=None, height=None):
+        """生成图像尺寸和文件大小的描述文本，未提供尺寸时才打开文件读取"""
+        try:
+            if width is None or height is None:
+                with Image.open(file_path) as img:
+                    width, height = img.size
+            return f"尺寸: {width}x{height}px    文件大小: {os.path.getsize(file_path) / 1024:.1f} KB"
+        except Exception:
+            return ""
+
+    def _show_image_info(self, image_info, size_text):
+        """在信息框中显示图像基本信息"""
         self.info_text.config(state="normal")
         self.info_text.delete(1.0, tk.END)
         info1 = f"文件名: {image_info.get('文件名', '')}    格式: {image_info.get('格式', '')}"
-        info2 = f"拍摄日期: {image_info.get('拍摄日期', '未知')} {image_info.get('拍摄时间', '')}    "
-        try:
-            with Image.open(file_path) as img:
-                info2 += f"尺寸: {img.width}x{img.height}px    文件大小: {os.path.getsize(file_path) / 1024:.1f} KB"
-        except:
-            pass
+        info2 = f"拍摄日期: {image_info.get('拍摄日期', '未知')} {image_info.get('拍摄时间', '')}    " + size_text
         self.info_text.insert(tk.END, info1 + "\n" + info2)
         # Keep the text box disabled for user interaction, but allow code to modify it.
         # self.info_text.config(state="disabled")
 
     def toggle_detection_preview(self, *args):
+        if self._suppress_toggle:
+            return
         if self.controller.is_processing:
             self.show_detection_var.set(True)
             return
@@ -404,17 +599,12 @@ class PreviewPage(ttk.Frame):
         file_path = os.path.join(self.controller.start_page.file_path_entry.get(), file_name)
         # self.controller.status_bar.status_label.config(text="正在检测图像...")
         self.detect_button.config(state="disabled")
-        threading.Thread(target=self._detect_image_thread, args=(file_path, file_name), daemon=True).start()
+        threading.Thread(target=self._detect_image_thread,
+                         args=(file_path, file_name, self.controller.get_detection_params()), daemon=True).start()
 
-    def _detect_image_thread(self, img_path, filename):
+    def _detect_image_thread(self, img_path, filename, detect_params):
         try:
-            from datetime import datetime
-            results = self.controller.image_processor.detect_species(img_path,
-                                                                     self.controller.advanced_page.controller.use_fp16_var.get(),
-                                                                     self.controller.advanced_page.controller.iou_var.get(),
-                                                                     self.controller.advanced_page.controller.conf_var.get(),
-                                                                     self.controller.advanced_page.controller.use_augment_var.get(),
-                                                                     self.controller.advanced_page.controller.use_agnostic_nms_var.get())
+            results = self.controller.image_processor.detect_species(img_path, **detect_params)
             self.current_detection_results = results['detect_results']
             species_info = {k: v for k, v in results.items() if k != 'detect_results'}
             species_info['检测时间'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -425,6 +615,7 @@ class PreviewPage(ttk.Frame):
                                                                     temp_photo_dir)
                 self.controller.image_processor.save_detection_info_json(self.current_detection_results, filename,
                                                                          species_info, temp_photo_dir)
+                self.mark_detected(filename)
 
             self.master.after(0, lambda: self.show_detection_var.set(True))
             self.master.after(0, lambda: self.update_image_preview(img_path, True, self.current_detection_results))
@@ -437,13 +628,6 @@ class PreviewPage(ttk.Frame):
             # self.master.after(0, lambda: self.controller.status_bar.status_label.config(text="检测完成"))
 
     def _update_detection_info(self, species_info):
-        self.info_text.config(state="normal")
-        current_text_lines = self.info_text.get(1.0, tk.END).strip().split('\n')
-        basic_info = "\n".join(current_text_lines[:2])
-
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, basic_info)
-
         detection_parts = ["检测结果:"]
         if species_info and species_info.get('物种名称'):
             names = species_info['物种名称'].split(',')
@@ -457,10 +641,12 @@ class PreviewPage(ttk.Frame):
         else:
             detection_parts.append("未检测到已知物种")
 
-        self.info_text.insert(tk.END, "\n" + " | ".join(detection_parts))
+        # 前两行为图像基本信息，只替换其后的检测结果，一次修改完成更新
+        self.info_text.config(state="normal")
+        self.info_text.replace("2.end", tk.END, "\n" + " | ".join(detection_parts))
         self.info_text.config(state="disabled")
 
-    def _resize_image_to_fit(self, img, max_width, max_height):
+    def _resize_image_to_fit(self, img, max_width, max_height, resample=Image.BILINEAR):
         if not all([max_width > 0, max_height > 0]):
             max_width, max_height = 400, 300
         w, h = img.size
@@ -469,7 +655,60 @@ class PreviewPage(ttk.Frame):
         if scale >= 1: return img
         new_width = max(1, int(w * scale))
         new_height = max(1, int(h * scale))
-        return img.resize((new_width, new_height), Image.LANCZOS)
+        # 预览图尺寸较小，BILINEAR与LANCZOS视觉差异可忽略，但计算量小得多
+        return img.resize((new_width, new_height), resample)
+
+    def _open_for_preview(self, file_path):
+        """返回解码后的图像和原始尺寸，最近打开过且未修改的文件直接使用缓存"""
+        key = (file_path, os.stat(file_path).st_mtime_ns)
+        with self._decoded_cache_lock:
+            cached = self._decoded_cache.get(key)
+            if cached is not None:
+                self._decoded_cache.move_to_end(key)
+                return cached
+        decoded = self._decode_for_preview(file_path)
+        with self._decoded_cache_lock:
+            self._decoded_cache[key] = decoded
+            if len(self._decoded_cache) > PREVIEW_CACHE_SIZE:
+                self._decoded_cache.popitem(last=False)
+        return decoded
+
+    def _decode_for_preview(self, file_path):
+        """以不小于屏幕的尺寸解码图像，返回解码后的图像和原始尺寸"""
+        if _turbo_jpeg is not None and file_path.lower().endswith(('.jpg', '.jpeg')):
+            try:
+                return self._decode_jpeg_scaled(file_path)
+            except Exception as e:
+                logger.warning(f"TurboJPEG解码失败，改用PIL解码 ({file_path}): {e}")
+        img = Image.open(file_path)
+        original_size = img.size
+        # JPEG可在解码时直接按1/2、1/4、1/8缩小，省去大部分解码工作
+        img.draft(img.mode, self._screen_size)
+        img.load()
+        return self._reduce_to_screen(img), original_size
+
+    def _decode_jpeg_scaled(self, file_path):
+        """用复用的TurboJPEG解码器按不小于屏幕的最大缩小比例直接解码JPEG"""
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        width, height, _, _ = _turbo_jpeg.decode_header(data)
+        scale = (1, 1)
+        for num, den in ((1, 8), (1, 4), (1, 2)):
+            if width * num // den >= self._screen_size[0] and height * num // den >= self._screen_size[1]:
+                scale = (num, den)
+                break
+        pixels = _turbo_jpeg.decode(data, pixel_format=TJPF_RGB, scaling_factor=scale)
+        return self._reduce_to_screen(Image.fromarray(pixels)), (width, height)
+
+    def _reduce_to_screen(self, img):
+        """将原图按整数倍缩小到不小于屏幕的尺寸，之后的缩放都基于该缓存进行"""
+        if img.mode not in ("RGB", "RGBA", "L"):
+            return img
+        w, h = img.size
+        factor = min(w // self._screen_size[0], h // self._screen_size[1])
+        if factor < 2:
+            return img
+        return img.reduce(factor)
 
     def on_image_double_click(self, event):
         pass
@@ -479,9 +718,9 @@ class PreviewPage(ttk.Frame):
         if not photo_dir or not os.path.exists(photo_dir):
             return
         self.validation_listbox.delete(0, tk.END)
-        processed_images = sorted([f for f in os.listdir(photo_dir) if f.lower().endswith(SUPPORTED_IMAGE_EXTENSIONS)])
-        for file in processed_images:
-            self.validation_listbox.insert(tk.END, file)
+        processed_images = list_image_files(photo_dir)
+        if processed_images:
+            self.validation_listbox.insert(tk.END, *processed_images)
         self._update_validation_progress()
         if processed_images:
             unvalidated_index = next((i for i, f in enumerate(processed_images) if f not in self.validation_data), -1)
@@ -501,15 +740,15 @@ class PreviewPage(ttk.Frame):
         if not photo_dir: return
         file_path = os.path.join(photo_dir, file_name)
         try:
-            img = Image.open(file_path)
+            img, _ = self._open_for_preview(file_path)
             self.validation_original_image = img  # 保存原始图像
             resized_img = self._resize_image_to_fit(img, self.validation_image_label.winfo_width(),
                                                     self.validation_image_label.winfo_height())
-            photo = ImageTk.PhotoImage(resized_img)
-            self.validation_image_label.config(image=photo)
-            self.validation_image_label.image = photo
+            self._set_label_photo(self.validation_image_label, resized_img)
         except Exception as e:
             logger.error(f"加载校验图像失败: {e}")
+            self.validation_image_label.config(image='', text="无法加载图像")
+            self.validation_image_label.image = None
             self.validation_original_image = None  # 加载失败时清除
 
         json_path = os.path.join(photo_dir, f"{os.path.splitext(file_name)[0]}.json")
@@ -517,8 +756,7 @@ class PreviewPage(ttk.Frame):
         self.validation_info_text.delete(1.0, tk.END)
         if os.path.exists(json_path):
             try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    info = json.load(f)
+                info = self._read_detection_json(json_path)
                 info_text = f"物种: {info.get('物种名称', 'N/A')}\n数量: {info.get('物种数量', 'N/A')}\n置信度: {info.get('最低置信度', 'N/A')}"
                 self.validation_info_text.insert(tk.END, info_text)
             except:
@@ -581,10 +819,9 @@ class PreviewPage(ttk.Frame):
             return
         error_folder = os.path.join(save_dir, "error")
         os.makedirs(error_folder, exist_ok=True)
-        from shutil import copy
         for file in error_files:
             try:
-                copy(os.path.join(source_dir, file), error_folder)
+                shutil.copy(os.path.join(source_dir, file), error_folder)
             except Exception as e:
                 logger.error(f"复制错误图片失败: {e}")
         messagebox.showinfo("成功", f"成功导出 {len(error_files)} 张错误图片到 {error_folder}")
@@ -593,24 +830,37 @@ class PreviewPage(ttk.Frame):
         messagebox.showinfo("提示", "此功能尚未实现。")
 
     def _on_resize(self, event):
+        # 拖动窗口时会连续触发大量Configure事件，合并为一次延迟缩放
+        if event.widget not in (self.image_label, self.validation_image_label):
+            return
+        # 尺寸停止变化200毫秒后再用LANCZOS重绘一次
+        settle_job = self._settle_resize.get(event.widget)
+        if settle_job:
+            self.after_cancel(settle_job)
+        self._settle_resize[event.widget] = self.after(200, self._do_resize, event.widget, True)
+        if event.widget in self._pending_resize:
+            return
+        self._pending_resize[event.widget] = self.after(30, self._do_resize, event.widget)
+
+    def _do_resize(self, label_widget, settled=False):
+        """按标签的最终尺寸重新缩放图片，拖动过程中使用BILINEAR，稳定后使用LANCZOS"""
+        if settled:
+            self._settle_resize.pop(label_widget, None)
+        else:
+            self._pending_resize.pop(label_widget, None)
         # 确定是哪个标签触发了事件
-        if event.widget == self.image_label:
+        if label_widget == self.image_label:
             image_to_resize = self.original_image
-            label_widget = self.image_label
-        elif event.widget == self.validation_image_label:
-            image_to_resize = self.validation_original_image
-            label_widget = self.validation_image_label
         else:
-            return
+            image_to_resize = self.validation_original_image
 
         # 如果有原始图片，则根据新大小重新缩放
         if image_to_resize:
-            # 获取标签的新尺寸
-            width, height = event.width, event.height
+            # 获取标签的最新尺寸
+            width, height = label_widget.winfo_width(), label_widget.winfo_height()
             if width < 2 or height < 2: return  # 避免尺寸过小时出错
 
             # 重新缩放并更新图片
-            resized_img = self._resize_image_to_fit(image_to_resize, width, height)
-            photo = ImageTk.PhotoImage(resized_img)
-            label_widget.config(image=photo)
-            label_widget.image = photo
\ No newline at end of file
+            resample = Image.LANCZOS if settled else Image.BILINEAR
+            resized_img = self._resize_image_to_fit(image_to_resize, width, height, resample)
+            self._set_label_photo(label_widget, resized_img)
\ No newline at end of file
@@ -1,11 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import os
 
 from system.config import APP_VERSION
-from system.utils import resource_path
-from system.gui.ui_components import RoundedButton
+from system.gui.ui_components import RoundedButton, load_logo_photo
 
 
 class Sidebar(ttk.Frame):
@@ -22,24 +20,18 @@ class Sidebar(ttk.Frame):
         logo_frame = ttk.Frame(self, style="Sidebar.TFrame")
         logo_frame.pack(fill="x", pady=(20, 10))
         try:
-            logo_path = resource_path("res/logo.png")
-            logo_img = Image.open(logo_path).resize((50, 50), Image.LANCZOS)
-            self.logo_photo = ImageTk.PhotoImage(logo_img)
-            ttk.Label(logo_frame, image=self.logo_photo, background=self.controller.sidebar_bg).pack(pady=(0, 5))
+            self.logo_photo = load_logo_photo((50, 50))
+            ttk.Label(logo_frame, image=self.logo_photo, style="Sidebar.TLabel").pack(pady=(0, 5))
         except Exception:
             pass
 
-        ttk.Label(
-            logo_frame, text="动物检测系统", font=("Segoe UI", 12, "bold"),
-            foreground=self.controller.sidebar_fg, background=self.controller.sidebar_bg
-        ).pack()
+        ttk.Label(logo_frame, text="动物检测系统", style="Sidebar.Title.TLabel").pack()
 
         # 使用StringVar来确保UI更新
         self.update_notification_text = tk.StringVar()
+        # 亮黄色粗体提示，颜色和字体由样式统一配置
         self.update_notification_label = ttk.Label(
-            logo_frame, textvariable=self.update_notification_text, font=("Segoe UI", 9, "bold"),
-            foreground="#FFFF00",  # 使用明确的亮黄色
-            background=self.controller.sidebar_bg
+            logo_frame, textvariable=self.update_notification_text, style="Sidebar.Notification.TLabel"
         )
         self.update_notification_label.pack(pady=(5, 0))
 
@@ -47,6 +39,7 @@ class Sidebar(ttk.Frame):
 
         buttons_frame = tk.Frame(self, bg=self.controller.sidebar_bg)
         buttons_frame.pack(fill="x", padx=10, pady=5)
+        self.buttons_frame = buttons_frame
         menu_items = [
             ("settings", "开始"),
             ("preview", "图像预览"),
@@ -69,10 +62,7 @@ class Sidebar(ttk.Frame):
             self.nav_buttons[page_id] = button
 
         ttk.Frame(self, style="Sidebar.TFrame").pack(fill="both", expand=True)
-        ttk.Label(
-            self, text=f"V{APP_VERSION}", foreground=self.controller.sidebar_fg,
-            background=self.controller.sidebar_bg, font=("Segoe UI", 8)
-        ).pack(pady=(0, 10))
+        ttk.Label(self, text=f"V{APP_VERSION}", style="Sidebar.Version.TLabel").pack(pady=(0, 10))
 
     def set_active_button(self, page_id):
         for pid, button in self.nav_buttons.items():
@@ -88,38 +78,20 @@ class Sidebar(ttk.Frame):
         self.update_notification_text.set(message)
 
     def update_theme(self):
-        # 1. Update the style definition. This is the proper way to style ttk widgets.
-        style = ttk.Style()
-        style.configure("Sidebar.TFrame", background=self.controller.sidebar_bg)
-
-        # 2. Apply the updated style to the main sidebar frame and its ttk children.
-        self.configure(style="Sidebar.TFrame")
-
-        # 3. Manually update the background of specific widgets.
-        # This is necessary for standard tk widgets or complex custom widgets.
-        for widget in self.winfo_children():
-            # Update standard tk.Frame (used as a container for buttons)
-            if isinstance(widget, tk.Frame):
-                widget.configure(bg=self.controller.sidebar_bg)
-
-            # Update ttk.Labels directly.
-            elif isinstance(widget, ttk.Label):
-                widget.configure(background=self.controller.sidebar_bg)
-
-            # Update children of the ttk.Frame that holds the logo
-            elif isinstance(widget, ttk.Frame):
-                for sub_widget in widget.winfo_children():
-                    if isinstance(sub_widget, ttk.Label):
-                        sub_widget.configure(background=self.controller.sidebar_bg)
-
-        # 4. Update the custom RoundedButton widgets with their new colors.
+        # 1. ttk frames and labels use the Sidebar.* styles configured in _setup_styles,
+        # so they pick up the new colors without touching each widget.
+        # 2. Only the plain tk.Frame holding the buttons needs its background set directly.
+        self.buttons_frame.configure(bg=self.controller.sidebar_bg)
+
+        # 3. Update the custom RoundedButton widgets with their new colors.
         for button in self.nav_buttons.values():
             button.bg = self.controller.sidebar_bg
+            button.hover_bg = self.controller.sidebar_hover_bg
             button.fg = self.controller.sidebar_fg
             button.highlight_color = self.controller.highlight_color
             button.parent_bg = self.controller.sidebar_bg
             button.configure(bg=self.controller.sidebar_bg)  # Update the canvas background
             button.set_active(button.active)  # Redraw the button with new colors
 
-        # 5. Re-set the active button to ensure highlighting is correct.
+        # 4. Re-set the active button to ensure highlighting is correct.
         self.set_active_button(self.controller.current_page)
\ No newline at end of file
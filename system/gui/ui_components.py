@@ -2,10 +2,46 @@ import tkinter as tk
 from tkinter import ttk
 import logging
 import sys
+import os
+import functools
+import time
 import platform  # 导入 platform 模块
+from PIL import Image, ImageTk
+
+from system.utils import resource_path
 
 logger = logging.getLogger(__name__)
 
+# 平台判断在导入时计算一次，避免每次创建控件时重复调用platform.system()
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_DARWIN = platform.system() == "Darwin"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_logo_source():
+    """读取并解码一次Logo原图"""
+    img = Image.open(resource_path(os.path.join("res", "logo.png")))
+    img.load()
+    return img
+
+
+@functools.lru_cache(maxsize=16)
+def load_logo_photo(size):
+    """获取指定尺寸的Logo图像，缓存同时保留PhotoImage引用，避免被回收"""
+    return ImageTk.PhotoImage(_load_logo_source().resize(size, Image.LANCZOS))
+
+
+@functools.lru_cache(maxsize=8)
+def derive_hover_color(bg):
+    """根据背景色亮度计算悬停色：深色背景变亮，浅色背景变暗"""
+    value = int(bg[1:], 16)
+    r, g, b = value >> 16, (value >> 8) & 0xFF, value & 0xFF
+    brightness = (r * 299 + g * 587 + b * 114) / 1000
+
+    if brightness < 128:  # 深色背景
+        return f"#{min(255, int(r * 1.3)):02x}{min(255, int(g * 1.3)):02x}{min(255, int(b * 1.3)):02x}"
+    return f"#{max(0, int(r * 0.9)):02x}{max(0, int(g * 0.9)):02x}{max(0, int(b * 0.9)):02x}"
+
 
 class RoundedButton(tk.Canvas):
     """圆角按钮实现 - 选中时在左侧显示高亮指示条"""
@@ -89,16 +125,8 @@ class RoundedButton(tk.Canvas):
         self.parent_bg = parent_bg  # 保存父组件背景色
         self.show_indicator = show_indicator  # 是否显示左侧高亮指示条
 
-        # 计算悬停状态的颜色
-        r, g, b = [int(self.bg[i:i + 2], 16) for i in (1, 3, 5)]
-        brightness = (r * 299 + g * 587 + b * 114) / 1000
-
-        if brightness < 128:  # 深色背景
-            # 变亮
-            self.hover_bg = f"#{min(255, int(r * 1.3)):02x}{min(255, int(g * 1.3)):02x}{min(255, int(b * 1.3)):02x}"
-        else:
-            # 变暗
-            self.hover_bg = f"#{max(0, int(r * 0.9)):02x}{max(0, int(g * 0.9)):02x}{max(0, int(b * 0.9)):02x}"
+        # 计算悬停状态的颜色，同色按钮共用缓存结果
+        self.hover_bg = derive_hover_color(self.bg)
 
         # 绘制初始状态
         self._draw_button("normal")
@@ -111,15 +139,12 @@ class RoundedButton(tk.Canvas):
 
     def update_theme(self):
         """更新按钮的主题以匹配父主题。"""
-        try:
-            # 这对于tk和ttk小部件都应该有效
+        # ttk小部件没有background选项，直接按类型取背景色，不再先尝试再捕获异常
+        if isinstance(self.master, ttk.Widget):
+            new_parent_bg = ttk.Style().lookup('TFrame', 'background')
+        else:
             new_parent_bg = self.master.cget('background')
-            self.config(bg=new_parent_bg)
-        except Exception:
-            # 复杂小部件或主题问题的后备方案
-            style = ttk.Style()
-            new_parent_bg = style.lookup('TFrame', 'background')
-            self.config(bg=new_parent_bg)
+        self.config(bg=new_parent_bg)
 
         self.parent_bg = self.cget('background')
 
@@ -323,6 +348,9 @@ class SpeedProgressBar(ttk.Frame):
         self.speed_text = "速度: 0.00 张/秒"
         self.time_text = "剩余: N/A"
         # ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^
+        self._last_draw_time = 0.0
+        self._pending_draw = None
+        self._drawn_state = None
         self._create_widgets()
         self.hide()
 
@@ -406,16 +434,35 @@ class SpeedProgressBar(ttk.Frame):
             if isinstance(remaining_time, (int, float)):
                 if remaining_time == float('inf') or remaining_time > 3600 * 24:  # 避免过大的数字
                     self.time_text = "剩余: 计算中"
-                elif remaining_time > 60:
-                    minutes = int(remaining_time // 60)
-                    seconds = int(remaining_time % 60)
-                    self.time_text = f"剩余: {minutes}分{seconds}秒"
                 else:
-                    self.time_text = f"剩余: {int(remaining_time)}秒"
+                    # 只按显示的整数秒分支，整数秒不变时生成的文字也不变
+                    remaining_seconds = int(remaining_time)
+                    if remaining_seconds > 60:
+                        minutes, seconds = divmod(remaining_seconds, 60)
+                        self.time_text = f"剩余: {minutes}分{seconds}秒"
+                    else:
+                        self.time_text = f"剩余: {remaining_seconds}秒"
             else:
                 # 如果是字符串 (例如 "已完成"), 直接显示
                 self.time_text = f"剩余: {remaining_time}"
 
+        # 重绘最多每0.1秒一次，被跳过的更新由延迟重绘补上，最后一次更新总是立即重绘，确保显示100%
+        if value < self.total_var.get() and time.monotonic() - self._last_draw_time < 0.1:
+            if self._pending_draw is None:
+                self._pending_draw = self.after(100, self._flush_draw)
+            return
+        self._flush_draw()
+
+    def _flush_draw(self):
+        if self._pending_draw is not None:
+            self.after_cancel(self._pending_draw)
+            self._pending_draw = None
+        self._last_draw_time = time.monotonic()
+        # 显示内容与上次绘制完全相同时跳过重绘
+        state = (self.progress_var.get(), self.total_var.get(), self.speed_text, self.time_text)
+        if state == self._drawn_state:
+            return
+        self._drawn_state = state
         self._draw_progressbar()
         self.update_idletasks()
     # ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^ ^
@@ -437,7 +484,7 @@ class CollapsiblePanel(ttk.Frame):
         if icon:
             try:
                 if isinstance(icon, str):
-                    font_name = "Segoe UI Emoji" if platform.system() == "Windows" else "Apple Color Emoji" if platform.system() == "Darwin" else "Noto Color Emoji"
+                    font_name = "Segoe UI Emoji" if _IS_WINDOWS else "Apple Color Emoji" if _IS_DARWIN else "Noto Color Emoji"
                     self.icon_label = tk.Label(self.header_frame, text=icon,
                                                font=(font_name, 20),
                                                bg=self.header_bg, fg=self.text_color)
@@ -525,4 +572,93 @@ class CollapsiblePanel(ttk.Frame):
 
     def bind_toggle_callback(self, callback):
         if callback not in self.toggle_callbacks:
-            self.toggle_callbacks.append(callback)
\ No newline at end of file
+            self.toggle_callbacks.append(callback)
+
+class VirtualListPopup(tk.Toplevel):
+    """虚拟列表弹出框 - 只渲染可见窗口内的条目，用于替代超长的下拉列表"""
+
+    def __init__(self, anchor, items, on_select=None, current=None, visible_rows=20):
+        """初始化虚拟列表弹出框
+
+        Args:
+            anchor: 弹出框依附的控件（显示在其正下方）
+            items: 全部条目列表
+            on_select: 选中条目后的回调函数，参数为条目文本
+            current: 当前选中的条目，打开时滚动到该位置
+            visible_rows: 同时显示的条目数量
+        """
+        super().__init__(anchor)
+        self.items = items
+        self.on_select = on_select
+        self.visible_rows = max(1, min(visible_rows, len(items)))
+        self.top = 0
+
+        self.overrideredirect(True)
+        self.transient(anchor.winfo_toplevel())
+
+        self.listbox = tk.Listbox(self, height=self.visible_rows, exportselection=False, activestyle="none")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.listbox.pack(side="left", fill="both", expand=True)
+
+        self.listbox.bind("<ButtonRelease-1>", self._on_click)
+        self.listbox.bind("<MouseWheel>", self._on_mousewheel)
+        self.listbox.bind("<Button-4>", self._on_mousewheel)
+        self.listbox.bind("<Button-5>", self._on_mousewheel)
+        self.bind("<Escape>", lambda e: self.close())
+        self.bind("<ButtonPress-1>", self._on_press_outside)
+
+        start = items.index(current) if current in items else 0
+        self._scroll_to(start - self.visible_rows // 2)
+        if current in items:
+            self.listbox.selection_set(start - self.top)
+
+        self.update_idletasks()
+        x = anchor.winfo_rootx()
+        y = anchor.winfo_rooty() + anchor.winfo_height()
+        self.geometry(f"{anchor.winfo_width()}x{self.listbox.winfo_reqheight()}+{x}+{y}")
+        self.focus_set()
+        self.grab_set()
+
+    def _scroll_to(self, top):
+        """将可见窗口移动到指定的起始索引，只重建窗口内的条目"""
+        max_top = max(0, len(self.items) - self.visible_rows)
+        self.top = max(0, min(int(top), max_top))
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *self.items[self.top:self.top + self.visible_rows])
+        total = len(self.items) or 1
+        self.scrollbar.set(self.top / total, (self.top + self.visible_rows) / total)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """处理滚动条的 moveto/scroll 命令"""
+        if action == "moveto":
+            self._scroll_to(float(amount) * len(self.items))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self._scroll_to(self.top + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self.top - 3)
+        else:
+            self._scroll_to(self.top + 3)
+        return "break"
+
+    def _on_click(self, event):
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        item = self.items[self.top + selection[0]]
+        self.close()
+        if self.on_select:
+            self.on_select(item)
+
+    def _on_press_outside(self, event):
+        """点击弹出框以外的区域时关闭"""
+        x, y = event.x_root - self.winfo_rootx(), event.y_root - self.winfo_rooty()
+        if not (0 <= x < self.winfo_width() and 0 <= y < self.winfo_height()):
+            self.close()
+
+    def close(self):
+        self.grab_release()
+        self.destroy()
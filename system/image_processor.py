@@ -1,18 +1,31 @@
 import os
+import json
+import hashlib
 import logging
 import concurrent.futures
 from typing import Dict, Any, Optional, List
 from collections import Counter
+import cv2
+import numpy as np
+import torch
+import yaml
+from PIL import Image
 from ultralytics import YOLO
 
+from system.config import DETECTION_BATCH_SIZE
+from system.utils import list_image_files
+
 logger = logging.getLogger(__name__)
 
 class ImageProcessor:
     """处理图像、检测物种的核心类"""
 
-    def __init__(self, model_path: str):
-        """初始化图像处理器"""
-        self.model = self._load_model(model_path)
+    def __init__(self, model_path: Optional[str] = None):
+        """初始化图像处理器，未提供模型路径时稍后通过load_model加载"""
+        self.model = self._load_model(model_path) if model_path else None
+        self.model_path = model_path
+        self.engine = None
+        self._engine_path = None
 
     def _load_model(self, model_path: str) -> Optional[YOLO]:
         """加载YOLO模型"""
@@ -25,37 +38,21 @@ class ImageProcessor:
 
     def detect_species(self, img_path: str, use_fp16: bool = False, iou: float = 0.3,
                        conf: float = 0.25, augment: bool = True,
-                       agnostic_nms: bool = True, timeout: float = 10.0) -> Dict[str, Any]:
-        """检测图像中的物种"""
-        try:
-            import torch
-            cuda_available = torch.cuda.is_available()
-            if not cuda_available:
-                use_fp16 = False
-        except ImportError:
-            use_fp16 = False
-        except Exception:
-            use_fp16 = False
-
-        species_names = ""
-        species_counts = ""
-        n = 0
-        detect_results = None
-        min_confidence = None
+                       agnostic_nms: bool = True, timeout: float = 10.0, image: Any = None) -> Dict[str, Any]:
+        """检测图像中的物种，提供预先解码的BGR图像数组时不再从img_path读取"""
+        use_fp16 = self._resolve_fp16(use_fp16)
 
         if not self.model:
-            return {
-                '物种名称': species_names,
-                '物种数量': species_counts,
-                'detect_results': detect_results,
-                '最低置信度': min_confidence
-            }
+            return self._summarize_results(None)
+
+        model = self._select_model(augment)
+        summary = None
 
         def run_detection():
-            nonlocal species_names, species_counts, n, detect_results, min_confidence
+            nonlocal summary
             try:
-                results = self.model(
-                    img_path,
+                results = model(
+                    image if image is not None else img_path,
                     augment=augment,
                     agnostic_nms=agnostic_nms,
                     imgsz=1024,
@@ -63,28 +60,7 @@ class ImageProcessor:
                     iou=iou,
                     conf=conf
                 )
-                detect_results = results
-
-                for r in results:
-                    data_list = r.boxes.cls.tolist()
-                    counts = Counter(data_list)
-                    species_dict = r.names
-                    confidences = r.boxes.conf.tolist()
-
-                    if confidences:
-                        current_min_confidence = min(confidences)
-                        if min_confidence is None or current_min_confidence < min_confidence:
-                            min_confidence = "%.3f" % current_min_confidence
-
-                    for element, count in counts.items():
-                        n += 1
-                        species_name = species_dict[int(element)]
-                        if n == 1:
-                            species_names += species_name
-                            species_counts += str(count)
-                        else:
-                            species_names += f",{species_name}"
-                            species_counts += f",{count}"
+                summary = self._summarize_results(self._results_to_cpu(results))
                 return True
             except Exception as e:
                 logger.error(f"物种检测失败: {e}")
@@ -99,13 +75,189 @@ class ImageProcessor:
             except concurrent.futures.TimeoutError:
                 raise TimeoutError(f"物种检测超时（>{timeout}秒）")
 
+        return summary
+
+    def detect_species_batch(self, images: List[Any], use_fp16: bool = False, iou: float = 0.3,
+                             conf: float = 0.25, augment: bool = True,
+                             agnostic_nms: bool = True, timeout: float = 10.0) -> List[Dict[str, Any]]:
+        """在一次模型调用中批量检测多张图像中的物种
+
+        Args:
+            images: 图像路径或预先解码的BGR图像数组列表
+            timeout: 单张图像的超时时间（秒），整批按图像数量累加
+
+        Returns:
+            与输入顺序一致的检测结果列表
+        """
+        use_fp16 = self._resolve_fp16(use_fp16)
+
+        if not self.model:
+            return [self._summarize_results(None) for _ in images]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self._select_model(augment),
+                images,
+                augment=augment,
+                agnostic_nms=agnostic_nms,
+                imgsz=1024,
+                half=use_fp16,
+                iou=iou,
+                conf=conf
+            )
+            try:
+                results = future.result(timeout=timeout * len(images))
+            except concurrent.futures.TimeoutError:
+                raise TimeoutError(f"批量物种检测超时（>{timeout * len(images)}秒）")
+
+        # 每张图像的结果单独包装为列表，与detect_species返回的结构保持一致
+        return [self._summarize_results([r]) for r in self._results_to_cpu(results)]
+
+    @staticmethod
+    def _results_to_cpu(results: Any) -> List[Any]:
+        """将检测结果中的张量移到内存，不再持有显存，后续保存和预览只需CPU上的数据"""
+        return [r.cpu() for r in results or []]
+
+    @staticmethod
+    def release_cuda_cache() -> None:
+        """归还PyTorch缓存但未使用的显存，减少长时间批量处理中的显存碎片"""
+        try:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception as e:
+            logger.warning(f"释放显存缓存失败: {e}")
+
+    def _select_model(self, augment: bool) -> YOLO:
+        """选择推理所用的模型，TensorRT引擎不支持测试时增强，启用增强时使用原模型"""
+        if self.engine is not None and not augment:
+            return self.engine
+        return self.model
+
+    def prepare_engine(self, use_fp16: bool = False, imgsz: int = 1024, int8: bool = False,
+                       calib_dir: str = "") -> bool:
+        """加载或构建当前模型的TensorRT引擎
+
+        引擎按模型文件指纹、输入尺寸、批大小和精度缓存在模型文件旁，只在首次使用时导出。
+
+        Args:
+            use_fp16: 是否构建半精度引擎
+            imgsz: 引擎固定的输入尺寸
+            int8: 是否构建INT8量化引擎
+            calib_dir: INT8校准使用的图像文件夹
+
+        Returns:
+            引擎是否可用
+        """
+        if not self.model_path or not self.model:
+            return False
+        if not self._cuda_available():
+            return False
+
+        precision = "int8" if int8 else ("fp16" if use_fp16 else "fp32")
+        stem = os.path.splitext(self.model_path)[0]
+        engine_path = (f"{stem}_{self._model_fingerprint()}_{imgsz}_b{DETECTION_BATCH_SIZE}"
+                       f"_{precision}.engine")
+        if self.engine is not None and self._engine_path == engine_path:
+            return True
+
+        try:
+            if not os.path.exists(engine_path):
+                logger.info(f"正在构建TensorRT引擎: {engine_path}")
+                export_args = dict(format="engine", imgsz=imgsz, half=use_fp16 and not int8,
+                                   dynamic=True, batch=DETECTION_BATCH_SIZE)
+                if int8:
+                    export_args.update(int8=True, data=self._write_calibration_data(stem, calib_dir))
+                exported = YOLO(self.model_path).export(**export_args)
+                os.replace(exported, engine_path)
+            self.engine = YOLO(engine_path, task="detect")
+            self._engine_path = engine_path
+            logger.info(f"已加载TensorRT引擎: {engine_path}")
+            return True
+        except Exception as e:
+            logger.error(f"准备TensorRT引擎失败，将使用原模型: {e}")
+            self.engine = None
+            self._engine_path = None
+            return False
+
+    def _model_fingerprint(self) -> str:
+        """根据模型文件大小和修改时间生成短指纹，模型文件被替换后不再复用旧引擎"""
+        stat = os.stat(self.model_path)
+        return hashlib.md5(f"{stat.st_size}-{stat.st_mtime_ns}".encode()).hexdigest()[:8]
+
+    def _write_calibration_data(self, stem: str, calib_dir: str, max_images: int = 200) -> str:
+        """从图像文件夹中均匀抽取图像，生成INT8校准用的数据集配置文件"""
+        image_files = list_image_files(calib_dir) if calib_dir and os.path.isdir(calib_dir) else []
+        if not image_files:
+            raise ValueError("INT8校准需要包含图像的文件夹")
+        step = max(1, len(image_files) // max_images)
+        sample = image_files[::step][:max_images]
+
+        list_path = f"{stem}_int8_calib.txt"
+        with open(list_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(os.path.join(calib_dir, name) for name in sample))
+
+        data_path = f"{stem}_int8_calib.yaml"
+        with open(data_path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump({"train": list_path, "val": list_path, "names": self.model.names}, f,
+                           allow_unicode=True)
+        return data_path
+
+    def release_engine(self) -> None:
+        """停止使用TensorRT引擎，之后的推理使用原模型"""
+        self.engine = None
+        self._engine_path = None
+
+    @staticmethod
+    def _resolve_fp16(use_fp16: bool) -> bool:
+        """仅在CUDA可用时启用半精度推理"""
+        return bool(use_fp16) and ImageProcessor._cuda_available()
+
+    @staticmethod
+    def _cuda_available() -> bool:
+        return torch.cuda.is_available()
+
+    @staticmethod
+    def _summarize_results(results: Any) -> Dict[str, Any]:
+        """汇总检测结果中的物种名称、数量和最低置信度（结果已由_results_to_cpu移到内存）"""
+        names = []
+        counts = []
+        min_confidence = None
+
+        for r in results or []:
+            if not r.boxes.cls.numel():
+                continue
+
+            # Counter保留类别首次出现的顺序
+            species_dict = r.names
+            for cls_id, count in Counter(r.boxes.cls.tolist()).items():
+                names.append(species_dict[int(cls_id)])
+                counts.append(str(count))
+
+            current_min_confidence = r.boxes.conf.min().item()
+            if min_confidence is None or current_min_confidence < min_confidence:
+                min_confidence = current_min_confidence
+
         return {
-            '物种名称': species_names,
-            '物种数量': species_counts,
-            'detect_results': detect_results,
-            '最低置信度': min_confidence
+            '物种名称': ",".join(names),
+            '物种数量': ",".join(counts),
+            'detect_results': results,
+            '最低置信度': "%.3f" % min_confidence if min_confidence is not None else None
         }
 
+    @staticmethod
+    def read_image(img_path: str) -> Any:
+        """以BGR数组读取图像，支持包含中文的路径，OpenCV无法解码的格式（如GIF）改用PIL读取，都失败时返回None"""
+        try:
+            img = cv2.imdecode(np.fromfile(img_path, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if img is not None:
+                return img
+            logger.info(f"OpenCV无法解码，改用PIL读取: {img_path}")
+            with Image.open(img_path) as pil_img:
+                return cv2.cvtColor(np.asarray(pil_img.convert("RGB")), cv2.COLOR_RGB2BGR)
+        except Exception as e:
+            logger.error(f"读取图像失败 ({img_path}): {e}")
+            return None
+
     def save_detection_result(self, results: Any, image_name: str, save_path: str) -> None:
         """保存探测结果图片"""
         if not results:
@@ -132,6 +284,13 @@ class ImageProcessor:
             logger.error(f"获取物种名称失败: {e}")
         return "unknown"
 
+    @staticmethod
+    def plot_to_image(result: Any):
+        """将检测结果绘制为PIL图像，直接按BGR顺序解码，省去单独的颜色转换"""
+        result_img = np.ascontiguousarray(result.plot())
+        height, width = result_img.shape[:2]
+        return Image.frombuffer("RGB", (width, height), result_img, "raw", "BGR", 0, 1)
+
     # V V V V V V V V V V V V V V V V V V V V
     # MODIFICATION: Accept dynamic temp_photo_dir
     # V V V V V V V V V V V V V V V V V V V V
@@ -144,11 +303,8 @@ class ImageProcessor:
             os.makedirs(temp_photo_dir, exist_ok=True)
             result_file = os.path.join(temp_photo_dir, image_name)
             for h in results:
-                from PIL import Image
-                result_img = h.plot()
-                result_img = Image.fromarray(result_img[..., ::-1])
-                compressed_img, quality = self._compress_image_for_temp(result_img)
-                compressed_img.save(result_file, "JPEG", quality=quality)
+                # 文件名沿用原图名，预览时PIL按内容识别JPEG
+                self._encode_temp_jpeg(h.plot()).tofile(result_file)
                 return result_file
         except Exception as e:
             logger.error(f"保存临时检测结果图片失败: {e}")
@@ -160,7 +316,6 @@ class ImageProcessor:
             return ""
 
         try:
-            import json
             os.makedirs(temp_photo_dir, exist_ok=True)
             data_to_save = {
                 "物种名称": species_info.get('物种名称', ''),
@@ -197,28 +352,23 @@ class ImageProcessor:
             from ultralytics import YOLO
             self.model = YOLO(model_path)
             self.model_path = model_path
+            self.engine = None
+            self._engine_path = None
             logger.info(f"模型已加载: {model_path}")
 
         except Exception as e:
             logger.error(f"加载模型失败: {e}")
             raise Exception(f"加载模型失败: {e}")
 
-    def _compress_image_for_temp(self, img, max_width=1280, quality=85):
-        """压缩图像以节省临时存储空间"""
-        try:
-            from PIL import Image
-            import numpy as np
-
-            if isinstance(img, np.ndarray):
-                img = Image.fromarray(img)
-
-            width, height = img.size
-            if width > max_width:
-                ratio = max_width / width
-                new_height = int(height * ratio)
-                img = img.resize((max_width, new_height), Image.LANCZOS)
-
-            return img, quality
-        except Exception as e:
-            logger.error(f"压缩图像失败: {e}")
-            return img, 95
\ No newline at end of file
+    @staticmethod
+    def _encode_temp_jpeg(img_bgr, max_width=1280, quality=85):
+        """将BGR图像缩放到临时预览尺寸并直接用OpenCV编码为JPEG字节"""
+        height, width = img_bgr.shape[:2]
+        if width > max_width:
+            img_bgr = cv2.resize(img_bgr, (max_width, int(height * max_width / width)),
+                                 interpolation=cv2.INTER_AREA)
+        ok, buffer = cv2.imencode('.jpg', img_bgr, [cv2.IMWRITE_JPEG_QUALITY, quality,
+                                                    cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+        if not ok:
+            raise ValueError("JPEG编码失败")
+        return buffer
\ No newline at end of file
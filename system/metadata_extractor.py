@@ -28,38 +28,64 @@ class ImageMetadataExtractor:
         """
         try:
             img = Image.open(img_path)
-            file_type = filename.split('.')[-1].lower()
-
-            image_info = {
+            return ImageMetadataExtractor._build_image_info(img, filename), img
+        except Exception as e:
+            logger.error(f"提取图像元数据失败 ({filename}): {e}")
+            return {
                 '文件名': filename,
-                '格式': file_type,
-                '拍摄日期': None,
-                '拍摄时间': None,
-                '拍摄日期对象': None,
-                '工作天数': None,
-                '物种名称': '',
-                '物种数量': '',
-                'detect_results': None,
-                '最低置信度': None,
-                '独立探测首只': '',
-            }
+                '格式': filename.split('.')[-1].lower(),
+            }, None
+
+    @staticmethod
+    def extract_metadata_only(img_path: str, filename: str) -> Dict[str, Any]:
+        """只提取图像元数据，不保留图像对象
 
-            # 提取EXIF数据
-            exif = img._getexif()
-            if exif:
-                date_taken = ImageMetadataExtractor._get_date_from_exif(exif, filename)
-                if date_taken:
-                    image_info['拍摄日期'] = date_taken.strftime('%Y-%m-%d')
-                    image_info['拍摄时间'] = date_taken.strftime('%H:%M')
-                    image_info['拍摄日期对象'] = date_taken
+        Pillow打开图像时只读取文件头和EXIF，不解码像素，读取完立即关闭文件。
 
-            return image_info, img
+        Args:
+            img_path: 图像文件路径
+            filename: 图像文件名
+
+        Returns:
+            包含元数据的字典
+        """
+        try:
+            with Image.open(img_path) as img:
+                return ImageMetadataExtractor._build_image_info(img, filename)
         except Exception as e:
             logger.error(f"提取图像元数据失败 ({filename}): {e}")
             return {
                 '文件名': filename,
                 '格式': filename.split('.')[-1].lower(),
-            }, None
+            }
+
+    @staticmethod
+    def _build_image_info(img: Image.Image, filename: str) -> Dict[str, Any]:
+        """根据已打开图像的EXIF信息构建元数据字典"""
+        image_info = {
+            '文件名': filename,
+            '格式': filename.split('.')[-1].lower(),
+            '拍摄日期': None,
+            '拍摄时间': None,
+            '拍摄日期对象': None,
+            '工作天数': None,
+            '物种名称': '',
+            '物种数量': '',
+            'detect_results': None,
+            '最低置信度': None,
+            '独立探测首只': '',
+        }
+
+        # 提取EXIF数据
+        exif = img._getexif()
+        if exif:
+            date_taken = ImageMetadataExtractor._get_date_from_exif(exif, filename)
+            if date_taken:
+                image_info['拍摄日期'] = date_taken.strftime('%Y-%m-%d')
+                image_info['拍摄时间'] = date_taken.strftime('%H:%M')
+                # 以ISO字符串保存，可直接序列化且按字典序即时间顺序，导出前再转换为datetime
+                image_info['拍摄日期对象'] = date_taken.isoformat()
+        return image_info
 
     @staticmethod
     def _get_date_from_exif(exif: Dict, filename: str) -> Optional[datetime]:
@@ -7,6 +7,11 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class SettingsManager:
@@ -22,6 +27,8 @@ class SettingsManager:
         self.settings_dir = os.path.join(base_dir, "temp")
         self.settings_file = os.path.join(self.settings_dir, "settings.json")
         self.cache_file = os.path.join(self.settings_dir, "cache.json")
+        self.cache_records_file = os.path.join(self.settings_dir, "cache_records.jsonl")
+        self.photo_dir = os.path.join(self.settings_dir, "photo")
 
         # 确保设置目录存在
         self._ensure_settings_dir()
@@ -82,8 +89,11 @@ class SettingsManager:
             保存是否成功
         """
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
+            # 先写临时文件再替换，写入中断时保留原有缓存
+            tmp_file = self.cache_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(cache_data, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_file, self.cache_file)
             logger.info(f"处理缓存已保存到: {self.cache_file}")
             return True
         except Exception as e:
@@ -101,8 +111,9 @@ class SettingsManager:
             return None
 
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                content = f.read()
+            cache_data = orjson.loads(content) if orjson else json.loads(content)
             logger.info(f"处理缓存已从 {self.cache_file} 加载")
             return cache_data
         except Exception as e:
@@ -115,14 +126,13 @@ class SettingsManager:
         Returns:
             删除是否成功
         """
-        if not os.path.exists(self.cache_file):
-            logger.info(f"缓存文件不存在，无需删除: {self.cache_file}")
-            return True
-
         try:
             os.remove(self.cache_file)
             logger.info(f"处理缓存文件已删除: {self.cache_file}")
             return True
+        except FileNotFoundError:
+            logger.info(f"缓存文件不存在，无需删除: {self.cache_file}")
+            return True
         except Exception as e:
             logger.error(f"删除处理缓存文件失败: {e}")
             return False
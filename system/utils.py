@@ -6,8 +6,13 @@ import os
 import sys
 import logging
 
+from system.config import SUPPORTED_IMAGE_EXTENSIONS
+
 logger = logging.getLogger(__name__)
 
+# 带点的小写扩展名集合，每个文件名只需取出扩展名做一次哈希查找
+_IMAGE_EXTENSIONS = frozenset(ext.lower() for ext in SUPPORTED_IMAGE_EXTENSIONS)
+
 def resource_path(relative_path: str) -> str:
     """获取资源文件的绝对路径，支持PyInstaller打包"""
     try:
@@ -18,4 +23,13 @@ def resource_path(relative_path: str) -> str:
         return os.path.join(base_path, relative_path)
     except Exception as e:
         logger.error(f"获取资源路径失败: {e}")
-        return os.path.join(os.path.abspath("."), relative_path)
\ No newline at end of file
+        return os.path.join(os.path.abspath("."), relative_path)
+
+def list_image_files(directory: str) -> list:
+    """列出目录中所有支持格式的图像文件名，按名称排序"""
+    with os.scandir(directory) as entries:
+        image_files = [entry.name for entry in entries
+                       if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS
+                       and entry.is_file()]
+    image_files.sort()
+    return image_files